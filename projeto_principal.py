@@ -1,5 +1,267 @@
-import xml.etree.ElementTree as ET
-from datetime import datetime
+from functools import lru_cache
+from operator import methodcaller
+
+try:
+    from lxml import etree as ET
+    _LXML_DISPONIVEL = True
+except ImportError:  # lxml é opcional; usa o parser da biblioteca padrão
+    import xml.etree.ElementTree as ET
+    _LXML_DISPONIVEL = False
+
+NFE_NS = 'http://www.portalfiscal.inf.br/nfe'
+
+# Tags e caminhos em notação de Clark, dispensando o mapa de namespaces
+TAG_NFE = f'{{{NFE_NS}}}NFe'
+TAG_INF_NFE = f'{{{NFE_NS}}}infNFe'
+TAG_IDE = f'{{{NFE_NS}}}ide'
+TAG_N_NF = f'{{{NFE_NS}}}nNF'
+TAG_SERIE = f'{{{NFE_NS}}}serie'
+TAG_DH_EMI = f'{{{NFE_NS}}}dhEmi'
+TAG_EMIT = f'{{{NFE_NS}}}emit'
+TAG_CNPJ = f'{{{NFE_NS}}}CNPJ'
+TAG_X_NOME = f'{{{NFE_NS}}}xNome'
+TAG_X_FANT = f'{{{NFE_NS}}}xFant'
+TAG_IE = f'{{{NFE_NS}}}IE'
+TAG_ENDER_EMIT = f'{{{NFE_NS}}}enderEmit'
+TAG_DEST = f'{{{NFE_NS}}}dest'
+TAG_CPF = f'{{{NFE_NS}}}CPF'
+TAG_ENDER_DEST = f'{{{NFE_NS}}}enderDest'
+TAG_UF = f'{{{NFE_NS}}}UF'
+TAG_PROT_NFE = f'{{{NFE_NS}}}protNFe'
+TAG_INF_PROT = f'{{{NFE_NS}}}infProt'
+TAG_N_PROT = f'{{{NFE_NS}}}nProt'
+TAG_DH_RECBTO = f'{{{NFE_NS}}}dhRecbto'
+PATH_NFE_INF_NFE = f'{TAG_NFE}/{TAG_INF_NFE}'
+PATH_ENDER_EMIT_UF = f'{TAG_ENDER_EMIT}/{TAG_UF}'
+PATH_ENDER_DEST_UF = f'{TAG_ENDER_DEST}/{TAG_UF}'
+PATH_PROT_NFE_INF_PROT = f'{TAG_PROT_NFE}/{TAG_INF_PROT}'
+
+
+def compile_path(path):
+    """
+    Compila um caminho em notação de Clark em uma função de busca.
+    
+    Parameters
+    ----------
+    path : str
+        Caminho relativo em notação de Clark
+    
+    Returns
+    -------
+    callable
+        Função que retorna o primeiro elemento encontrado ou None
+    """
+    if _LXML_DISPONIVEL:
+        xpath = ET.ETXPath(path)
+        
+        def find_first(elem):
+            result = xpath(elem)
+            return result[0] if result else None
+        
+        return find_first
+    return methodcaller('find', path)
+
+
+def find_text(find, parent, default=""):
+    """
+    Retorna o texto do elemento localizado por ``find`` em ``parent``.
+    
+    Parameters
+    ----------
+    find : callable
+        Busca compilada por ``compile_path``
+    parent : Element
+        Elemento de contexto da busca
+    default : str, optional
+        Valor retornado se o elemento não existir ou estiver vazio (default: "")
+    
+    Returns
+    -------
+    str
+        Texto do elemento ou ``default``
+    """
+    elem = find(parent)
+    if elem is None or elem.text is None:
+        return default
+    return elem.text
+
+
+# Buscas da NFe compiladas no import (ETXPath com lxml)
+FIND_NFE_INF_NFE = compile_path(PATH_NFE_INF_NFE)
+FIND_INF_NFE = compile_path(TAG_INF_NFE)
+FIND_IDE = compile_path(TAG_IDE)
+FIND_N_NF = compile_path(TAG_N_NF)
+FIND_SERIE = compile_path(TAG_SERIE)
+FIND_DH_EMI = compile_path(TAG_DH_EMI)
+FIND_EMIT = compile_path(TAG_EMIT)
+FIND_CNPJ = compile_path(TAG_CNPJ)
+FIND_X_NOME = compile_path(TAG_X_NOME)
+FIND_X_FANT = compile_path(TAG_X_FANT)
+FIND_IE = compile_path(TAG_IE)
+FIND_ENDER_EMIT_UF = compile_path(PATH_ENDER_EMIT_UF)
+FIND_DEST = compile_path(TAG_DEST)
+FIND_CPF = compile_path(TAG_CPF)
+FIND_ENDER_DEST_UF = compile_path(PATH_ENDER_DEST_UF)
+FIND_PROT_NFE_INF_PROT = compile_path(PATH_PROT_NFE_INF_PROT)
+FIND_N_PROT = compile_path(TAG_N_PROT)
+FIND_DH_RECBTO = compile_path(TAG_DH_RECBTO)
+
+# Grupos não usados pelo DANFE Simplificado, descartados durante a leitura
+TAGS_DESCARTAVEIS = frozenset(
+    [f'{{{NFE_NS}}}{tag}' for tag in ('det', 'total', 'transp', 'cobr', 'pag', 'infAdic')]
+    + ['{http://www.w3.org/2000/09/xmldsig#}Signature']
+)
+ITERPARSE_OPTIONS = (
+    {'huge_tree': False, 'remove_blank_text': True, 'remove_comments': True,
+     'collect_ids': False, 'resolve_entities': False, 'no_network': True}
+    if _LXML_DISPONIVEL else {}
+)
+READ_BUFFER_SIZE = 256 * 1024  # leituras grandes: menos idas e voltas em shares SMB
+
+
+# Formatadores puros com cache: em lote, o mesmo emitente e as mesmas
+# datas se repetem em muitas etiquetas
+@lru_cache(maxsize=4096)
+def format_iso_date(iso_date):
+    """
+    Formata data ISO para formato brasileiro.
+    
+    Versão tolerante: entradas fora do formato são devolvidas sem alteração.
+    
+    Parameters
+    ----------
+    iso_date : str
+        Data no formato ISO (2025-09-01T08:55:05-03:00)
+    
+    Returns
+    -------
+    str
+        Data formatada (01/09/2025)
+    """
+    # Fatia diretamente o formato fixo AAAA-MM-DD, sem criar datetime
+    if not iso_date or len(iso_date) < 10 or iso_date[4] != '-' or iso_date[7] != '-':
+        return iso_date
+    return f"{iso_date[8:10]}/{iso_date[5:7]}/{iso_date[0:4]}"
+
+
+@lru_cache(maxsize=4096)
+def format_iso_datetime(iso_datetime):
+    """
+    Formata data/hora ISO para formato brasileiro.
+    
+    Versão tolerante: entradas fora do formato são devolvidas sem alteração.
+    
+    Parameters
+    ----------
+    iso_datetime : str
+        Data/hora no formato ISO
+    
+    Returns
+    -------
+    str
+        Data/hora formatada (01/09/2025 08:55:07)
+    """
+    data = format_iso_date(iso_datetime)
+    # AAAA-MM-DDTHH:MM:SS[±HH:MM]: acrescenta a hora, descartando o fuso
+    if data != iso_datetime and len(iso_datetime) >= 19 and iso_datetime[10] == 'T':
+        return f"{data} {iso_datetime[11:19]}"
+    return data
+
+
+def format_nfe_date(nfe_datetime):
+    """
+    Formata a data de um campo data/hora da NFe (dhEmi, dhRecbto).
+    
+    Assume o leiaute do schema (AAAA-MM-DDTHH:MM:SS±HH:MM) e apenas
+    reordena as fatias; para entradas arbitrárias use format_iso_date.
+    
+    Parameters
+    ----------
+    nfe_datetime : str
+        Data/hora no leiaute da NFe
+    
+    Returns
+    -------
+    str
+        Data formatada (01/09/2025)
+    """
+    return f"{nfe_datetime[8:10]}/{nfe_datetime[5:7]}/{nfe_datetime[0:4]}"
+
+
+def format_nfe_datetime(nfe_datetime):
+    """
+    Formata um campo data/hora da NFe (dhEmi, dhRecbto).
+    
+    Assume o leiaute do schema (AAAA-MM-DDTHH:MM:SS±HH:MM) e apenas
+    reordena as fatias; valores sem a parte de hora seguem para
+    format_iso_datetime, que devolve só a data.
+    
+    Parameters
+    ----------
+    nfe_datetime : str
+        Data/hora no leiaute da NFe
+    
+    Returns
+    -------
+    str
+        Data/hora formatada (01/09/2025 08:55:07)
+    """
+    if nfe_datetime[10:11] != 'T':
+        return format_iso_datetime(nfe_datetime)
+    return f"{nfe_datetime[8:10]}/{nfe_datetime[5:7]}/{nfe_datetime[0:4]} {nfe_datetime[11:19]}"
+
+
+@lru_cache(maxsize=4096)
+def format_document(documento):
+    """
+    Formata CNPJ ou CPF com máscara.
+    
+    Parameters
+    ----------
+    documento : str
+        Número do documento sem formatação
+    
+    Returns
+    -------
+    str
+        Documento formatado
+    """
+    if len(documento) == 14:  # CNPJ
+        return ''.join((documento[0:2], '.', documento[2:5], '.', documento[5:8], '/', documento[8:12], '-', documento[12:14]))
+    elif len(documento) == 11:  # CPF
+        return ''.join((documento[0:3], '.', documento[3:6], '.', documento[6:9], '-', documento[9:11]))
+    return documento
+
+
+# Layout da DANFE Simplificada; campos preenchidos via str.format_map
+ZPL_TEMPLATE = """^XA
+^CI28
+^MCY
+^FO30,20^GB265,130,3^FS
+^FO40,40^A0N,20,20^FD1 - Saida^FS
+^FO40,70^A0N,20,20^FH^FDNumero {numero}/Serie {serie}^FS
+^FO40,100^A0N,20,20^FH^FDEmissao {data_emissao}^FS
+^FO440,40^A0N,30,30^FDChave de acesso^FS
+^FO320,70^A0N,20,20^FD{chave_acesso}^FS
+^FO340,100^A0N,30,30^FH^FDProtocolo de Autorizacao de uso^FS
+^FO395,130^A0N,20,20^FD{protocolo} {data_autorizacao}^FS
+^FO135,190^BY2,,0^BCN,150,Y,N,N^FD>;{chave_acesso}^FS
+^FO0,355^A0N,25,25^FB675,1,0,R^FD^FS
+^FO0,380^GB800,1,3^FS
+^FO40,400^A0N,20,20^FH^FDREMETENTE: {emit_nome}^FS
+^FO40,430^A0N,20,20^FDCNPJ: {emit_cnpj}^FS
+^FO310,430^A0N,20,20^FH^FDINSCRICAO ESTADUAL: {emit_ie}^FS
+^FO690,430^A0N,20,20^FDUF: {emit_uf}^FS
+^FO40,500^A0N,20,20^FH^FDDESTINATARIO: {dest_nome}^FS
+^FO40,530^A0N,20,20^FD{dest_tipo_doc}: {dest_doc}^FS
+^FO690,530^A0N,20,20^FDUF: {dest_uf}^FS
+^FO40,560^A0N,20,20^FDDANFE SIMPLIFICADO^FS
+^FO0,600^GB800,1,3^FS
+^FO0,1000^GB800,1,3^FS
+^FO40,1020^A0N,25,25^FDDADOS ADICIONAIS^FS
+^FO40,1050^A0N,20,20^FB740,8,3,L^FH^FD^FS
+^XZ"""
+
 
 class DANFEGenerator:
     """
@@ -25,6 +287,7 @@ class DANFEGenerator:
         """
         self.xml_file_path = xml_file_path
         self.nfe_data = {}
+        self._zpl_cache = None
         self._extract_nfe_data()
     
     def _extract_nfe_data(self):
@@ -41,79 +304,76 @@ class DANFEGenerator:
         FileNotFoundError
             Se o arquivo XML não for encontrado
         ET.ParseError
-            Se o XML estiver malformado
+            Se o XML estiver malformado (XMLSyntaxError, com lxml)
         """
         try:
-            # Parse do XML
-            tree = ET.parse(self.xml_file_path)
-            root = tree.getroot()
+            # Parse do XML em passagem única: descarta os itens e demais grupos
+            # não usados e encerra a leitura ao fim do protocolo
+            root = None
+            with open(self.xml_file_path, 'rb', buffering=READ_BUFFER_SIZE) as xml_file:
+                for event, elem in ET.iterparse(xml_file, events=('start', 'end'), **ITERPARSE_OPTIONS):
+                    if root is None:
+                        root = elem
+                    elif event == 'end':
+                        if elem.tag in TAGS_DESCARTAVEIS:
+                            elem.clear()
+                        elif elem.tag == TAG_INF_PROT:
+                            break
             
-            # Define namespace
-            ns = {'nfe': 'http://www.portalfiscal.inf.br/nfe'}
+            # Localiza infNFe (nfeProc/NFe/infNFe ou NFe/infNFe); os demais
+            # grupos são filhos diretos, sem busca por descendentes
+            inf_nfe = FIND_NFE_INF_NFE(root)
+            if inf_nfe is None:
+                inf_nfe = FIND_INF_NFE(root)
+            if inf_nfe is None:
+                raise ValueError("Elemento 'infNFe' não encontrado no XML")
             
             # Extrai dados da identificação
-            ide = root.find('.//nfe:ide', ns)
+            ide = FIND_IDE(inf_nfe)
             if ide is None:
                 raise ValueError("Elemento 'ide' não encontrado no XML")
             
-            numero_elem = ide.find('nfe:nNF', ns)
-            serie_elem = ide.find('nfe:serie', ns)
-            data_elem = ide.find('nfe:dhEmi', ns)
-            
-            self.nfe_data['numero'] = numero_elem.text if numero_elem is not None else ""
-            self.nfe_data['serie'] = serie_elem.text if serie_elem is not None else ""
-            self.nfe_data['data_emissao'] = data_elem.text if data_elem is not None else ""
+            text = find_text
+            nfe_data = self.nfe_data
             
-            # Extrai chave de acesso do atributo Id
-            inf_nfe = root.find('.//nfe:infNFe', ns)
-            if inf_nfe is None:
-                raise ValueError("Elemento 'infNFe' não encontrado no XML")
+            nfe_data['numero'] = text(FIND_N_NF, ide)
+            nfe_data['serie'] = text(FIND_SERIE, ide)
+            nfe_data['data_emissao'] = text(FIND_DH_EMI, ide)
             
+            # Extrai chave de acesso do atributo Id ("NFe" + 44 dígitos)
             chave_completa = inf_nfe.get('Id', '')
-            self.nfe_data['chave_acesso'] = chave_completa.replace('NFe', '') if chave_completa else ""
+            nfe_data['chave_acesso'] = chave_completa[3:] if chave_completa.startswith('NFe') else chave_completa
             
             # Extrai dados do emitente
-            emit = root.find('.//nfe:emit', ns)
+            emit = FIND_EMIT(inf_nfe)
             if emit is None:
                 raise ValueError("Elemento 'emit' não encontrado no XML")
             
-            cnpj_emit = emit.find('nfe:CNPJ', ns)
-            nome_emit = emit.find('nfe:xNome', ns)
-            fantasia_emit = emit.find('nfe:xFant', ns)
-            ie_emit = emit.find('nfe:IE', ns)
-            uf_emit = emit.find('.//nfe:UF', ns)
-            
-            self.nfe_data['emit_cnpj'] = cnpj_emit.text if cnpj_emit is not None else ""
-            self.nfe_data['emit_nome'] = nome_emit.text if nome_emit is not None else ""
-            self.nfe_data['emit_fantasia'] = fantasia_emit.text if fantasia_emit is not None else ""
-            self.nfe_data['emit_ie'] = ie_emit.text if ie_emit is not None else ""
-            self.nfe_data['emit_uf'] = uf_emit.text if uf_emit is not None else ""
+            nfe_data['emit_cnpj'] = text(FIND_CNPJ, emit)
+            nfe_data['emit_nome'] = text(FIND_X_NOME, emit)
+            nfe_data['emit_fantasia'] = text(FIND_X_FANT, emit)
+            nfe_data['emit_ie'] = text(FIND_IE, emit)
+            nfe_data['emit_uf'] = text(FIND_ENDER_EMIT_UF, emit)
             
             # Extrai dados do destinatário
-            dest = root.find('.//nfe:dest', ns)
+            dest = FIND_DEST(inf_nfe)
             if dest is None:
                 raise ValueError("Elemento 'dest' não encontrado no XML")
             
-            cpf_elem = dest.find('nfe:CPF', ns)
-            cnpj_elem = dest.find('nfe:CNPJ', ns)
-            nome_dest = dest.find('nfe:xNome', ns)
-            uf_dest = dest.find('.//nfe:UF', ns)
-            
-            self.nfe_data['dest_doc'] = cpf_elem.text if cpf_elem is not None else (cnpj_elem.text if cnpj_elem is not None else "")
-            self.nfe_data['dest_tipo_doc'] = 'CPF' if cpf_elem is not None else 'CNPJ'
-            self.nfe_data['dest_nome'] = nome_dest.text if nome_dest is not None else ""
-            self.nfe_data['dest_uf'] = uf_dest.text if uf_dest is not None else ""
+            cpf = text(FIND_CPF, dest)
+            nfe_data['dest_doc'] = cpf or text(FIND_CNPJ, dest)
+            nfe_data['dest_tipo_doc'] = 'CPF' if cpf else 'CNPJ'
+            nfe_data['dest_nome'] = text(FIND_X_NOME, dest)
+            nfe_data['dest_uf'] = text(FIND_ENDER_DEST_UF, dest)
             
             # Extrai protocolo de autorização
-            prot = root.find('.//nfe:protNFe/nfe:infProt', ns)
+            prot = FIND_PROT_NFE_INF_PROT(root)
             if prot is not None:
-                prot_num = prot.find('nfe:nProt', ns)
-                prot_data = prot.find('nfe:dhRecbto', ns)
-                self.nfe_data['protocolo'] = prot_num.text if prot_num is not None else ""
-                self.nfe_data['data_autorizacao'] = prot_data.text if prot_data is not None else ""
+                nfe_data['protocolo'] = text(FIND_N_PROT, prot)
+                nfe_data['data_autorizacao'] = text(FIND_DH_RECBTO, prot)
             else:
-                self.nfe_data['protocolo'] = ""
-                self.nfe_data['data_autorizacao'] = ""
+                nfe_data['protocolo'] = ""
+                nfe_data['data_autorizacao'] = ""
                 
         except (ET.ParseError, FileNotFoundError, AttributeError) as e:
             raise ValueError(f"Erro ao processar XML da NFe: {e}") from e
@@ -132,13 +392,7 @@ class DANFEGenerator:
         str
             Data formatada (01/09/2025)
         """
-        try:
-            # Remove timezone e parse
-            date_part = iso_date.split('T')[0]
-            dt = datetime.strptime(date_part, '%Y-%m-%d')
-            return dt.strftime('%d/%m/%Y')
-        except (ValueError, AttributeError):
-            return iso_date
+        return format_iso_date(iso_date)
     
     def _format_datetime(self, iso_datetime):
         """
@@ -154,17 +408,7 @@ class DANFEGenerator:
         str
             Data/hora formatada (01/09/2025 08:55:07)
         """
-        try:
-            # Remove timezone e parse
-            datetime_part = iso_datetime.split('-03:00')[0] if '-03:00' in iso_datetime else iso_datetime.split('T')[0]
-            if 'T' in datetime_part:
-                dt = datetime.strptime(datetime_part, '%Y-%m-%dT%H:%M:%S')
-                return dt.strftime('%d/%m/%Y %H:%M:%S')
-            else:
-                dt = datetime.strptime(datetime_part, '%Y-%m-%d')
-                return dt.strftime('%d/%m/%Y')
-        except (ValueError, AttributeError):
-            return iso_datetime
+        return format_iso_datetime(iso_datetime)
     
     def _format_cnpj_cpf(self, documento):
         """
@@ -180,11 +424,7 @@ class DANFEGenerator:
         str
             Documento formatado
         """
-        if len(documento) == 14:  # CNPJ
-            return f"{documento[:2]}.{documento[2:5]}.{documento[5:8]}/{documento[8:12]}-{documento[12:14]}"
-        elif len(documento) == 11:  # CPF
-            return f"{documento[:3]}.{documento[3:6]}.{documento[6:9]}-{documento[9:11]}"
-        return documento
+        return format_document(documento)
     
     def generate_zpl(self):
         """
@@ -201,39 +441,35 @@ class DANFEGenerator:
         >>> zpl_code = generator.generate_zpl()
         >>> print(zpl_code)
         """
-        # Formata dados para exibição
-        data_emissao = self._format_date(self.nfe_data['data_emissao'])
-        data_autorizacao = self._format_datetime(self.nfe_data['data_autorizacao'])
+        # nfe_data não muda após a extração, então o código é gerado uma vez
+        if self._zpl_cache is None:
+            self._zpl_cache = self._build_zpl()
+        return self._zpl_cache
+    
+    def _build_zpl(self):
+        """
+        Monta o código ZPL a partir dos dados extraídos da NFe.
+        
+        Returns
+        -------
+        str
+            Código ZPL formatado para impressão da etiqueta DANFE
+        """
+        # Datas extraídas do XML seguem o leiaute da NFe; vazias quando ausentes
+        data_emissao = self.nfe_data['data_emissao']
+        data_emissao = format_nfe_date(data_emissao) if data_emissao else ""
+        data_autorizacao = self.nfe_data['data_autorizacao']
+        data_autorizacao = format_nfe_datetime(data_autorizacao) if data_autorizacao else ""
         cnpj_formatado = self._format_cnpj_cpf(self.nfe_data['emit_cnpj'])
         
-        # Gera código ZPL baseado no padrão da DANFE existente
-        zpl_code = f"""^XA
-^CI28
-^MCY
-^FO30,20^GB265,130,3^FS
-^FO40,40^A0N,20,20^FD1 - Saida^FS
-^FO40,70^A0N,20,20^FH^FDNumero {self.nfe_data['numero']}/Serie {self.nfe_data['serie']}^FS
-^FO40,100^A0N,20,20^FH^FDEmissao {data_emissao}^FS
-^FO440,40^A0N,30,30^FDChave de acesso^FS
-^FO320,70^A0N,20,20^FD{self.nfe_data['chave_acesso']}^FS
-^FO340,100^A0N,30,30^FH^FDProtocolo de Autorizacao de uso^FS
-^FO395,130^A0N,20,20^FD{self.nfe_data['protocolo']} {data_autorizacao}^FS
-^FO135,190^BY2,,0^BCN,150,Y,N,N^FD>;{self.nfe_data['chave_acesso']}^FS
-^FO0,355^A0N,25,25^FB675,1,0,R^FD^FS
-^FO0,380^GB800,1,3^FS
-^FO40,400^A0N,20,20^FH^FDREMETENTE: {self.nfe_data['emit_nome']}^FS
-^FO40,430^A0N,20,20^FDCNPJ: {cnpj_formatado}^FS
-^FO310,430^A0N,20,20^FH^FDINSCRICAO ESTADUAL: {self.nfe_data['emit_ie']}^FS
-^FO690,430^A0N,20,20^FDUF: {self.nfe_data['emit_uf']}^FS
-^FO40,500^A0N,20,20^FH^FDDESTINATARIO: {self.nfe_data['dest_nome']}^FS
-^FO40,530^A0N,20,20^FD{self.nfe_data['dest_tipo_doc']}: {self._format_cnpj_cpf(self.nfe_data['dest_doc'])}^FS
-^FO690,530^A0N,20,20^FDUF: {self.nfe_data['dest_uf']}^FS
-^FO40,560^A0N,20,20^FDDANFE SIMPLIFICADO^FS
-^FO0,600^GB800,1,3^FS
-^FO0,1000^GB800,1,3^FS
-^FO40,1020^A0N,25,25^FDDADOS ADICIONAIS^FS
-^FO40,1050^A0N,20,20^FB740,8,3,L^FH^FD^FS
-^XZ"""
+        # Preenche o template com os dados da NFe, sobrepondo os campos formatados
+        zpl_code = ZPL_TEMPLATE.format_map({
+            **self.nfe_data,
+            'data_emissao': data_emissao,
+            'data_autorizacao': data_autorizacao,
+            'emit_cnpj': cnpj_formatado,
+            'dest_doc': self._format_cnpj_cpf(self.nfe_data['dest_doc']),
+        })
         
         return zpl_code
     
@@ -259,8 +495,9 @@ class DANFEGenerator:
         """
         zpl_code = self.generate_zpl()
         
-        with open(output_file_param, 'w', encoding='utf-8') as f:
-            f.write(zpl_code)
+        # Grava os bytes já codificados de uma vez, sem tradução de quebras de linha
+        with open(output_file_param, 'wb') as f:
+            f.write(zpl_code.encode('utf-8'))
         
         return output_file_param
     
@@ -54,14 +54,12 @@ class BrazilianDateFormatter(DateFormatterInterface):
         2025
         """
         try:
-            # Remove timezone se presente
-            datetime_part = iso_date.split('-03:00')[0] if '-03:00' in iso_date else iso_date
+            # 'Z' só é aceito por fromisoformat a partir do Python 3.11
+            if iso_date.endswith('Z'):
+                iso_date = f"{iso_date[:-1]}+00:00"
 
-            if 'T' in datetime_part:
-                return datetime.strptime(datetime_part, '%Y-%m-%dT%H:%M:%S')
-            # Apenas data
-            date_part = datetime_part.split('T')[0]
-            return datetime.strptime(date_part, '%Y-%m-%d')
+            # Descarta o fuso, mantendo o horário local do documento
+            return datetime.fromisoformat(iso_date).replace(tzinfo=None)
         except ValueError as e:
             raise ValueError(f"Não foi possível converter a data '{iso_date}': {e}") from e
 
@@ -86,7 +84,8 @@ class BrazilianDateFormatter(DateFormatterInterface):
         >>> formatter.format_date(date)
         '01/09/2025'
         """
-        return date.strftime('%d/%m/%Y')
+        # Montagem direta: evita o strftime, dependente de locale
+        return f"{date.day:02d}/{date.month:02d}/{date.year:04d}"
 
     def format_datetime(self, date: datetime) -> str:
         """
@@ -109,4 +108,5 @@ class BrazilianDateFormatter(DateFormatterInterface):
         >>> formatter.format_datetime(date)
         '01/09/2025 08:55:05'
         """
-        return date.strftime('%d/%m/%Y %H:%M:%S')
+        return (f"{date.day:02d}/{date.month:02d}/{date.year:04d} "
+                f"{date.hour:02d}:{date.minute:02d}:{date.second:02d}")
@@ -5,9 +5,38 @@ Este módulo implementa formatação de documentos brasileiros
 (CPF e CNPJ) com suas respectivas máscaras.
 """
 
+from functools import lru_cache
+
 from ...domain.interfaces.document_formatter import DocumentFormatterInterface
 
 
+# Em lote, o mesmo CNPJ de emitente se repete em todas as etiquetas;
+# o cache evita validar e mascarar o mesmo documento novamente.
+# Entradas inválidas lançam ValueError e não são armazenadas.
+@lru_cache(maxsize=1024)
+def _format_cpf(cpf: str) -> str:
+    """Valida e aplica a máscara XXX.XXX.XXX-XX a um CPF."""
+    if not cpf or len(cpf) != 11:
+        raise ValueError(f"CPF deve ter exatamente 11 dígitos, recebido: '{cpf}'")
+
+    if not cpf.isdigit():
+        raise ValueError(f"CPF deve conter apenas dígitos, recebido: '{cpf}'")
+
+    return ''.join((cpf[0:3], '.', cpf[3:6], '.', cpf[6:9], '-', cpf[9:11]))
+
+
+@lru_cache(maxsize=1024)
+def _format_cnpj(cnpj: str) -> str:
+    """Valida e aplica a máscara XX.XXX.XXX/XXXX-XX a um CNPJ."""
+    if not cnpj or len(cnpj) != 14:
+        raise ValueError(f"CNPJ deve ter exatamente 14 dígitos, recebido: '{cnpj}'")
+
+    if not cnpj.isdigit():
+        raise ValueError(f"CNPJ deve conter apenas dígitos, recebido: '{cnpj}'")
+
+    return ''.join((cnpj[0:2], '.', cnpj[2:5], '.', cnpj[5:8], '/', cnpj[8:12], '-', cnpj[12:14]))
+
+
 class BrazilianDocumentFormatter(DocumentFormatterInterface):
     """
     Formatador de documentos brasileiros.
@@ -24,6 +53,10 @@ class BrazilianDocumentFormatter(DocumentFormatterInterface):
     '12.345.678/0001-95'
     """
 
+    def __init__(self):
+        """Inicializa a tabela de formatadores indexada pelo tamanho do documento."""
+        self._formatters_by_length = {11: self.format_cpf, 14: self.format_cnpj}
+
     def format_cpf(self, cpf: str) -> str:
         """
         Formata um CPF com máscara.
@@ -49,13 +82,7 @@ class BrazilianDocumentFormatter(DocumentFormatterInterface):
         >>> formatter.format_cpf("12345678901")
         '123.456.789-01'
         """
-        if not cpf or len(cpf) != 11:
-            raise ValueError(f"CPF deve ter exatamente 11 dígitos, recebido: '{cpf}'")
-
-        if not cpf.isdigit():
-            raise ValueError(f"CPF deve conter apenas dígitos, recebido: '{cpf}'")
-
-        return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:11]}"
+        return _format_cpf(cpf)
 
     def format_cnpj(self, cnpj: str) -> str:
         """
@@ -82,13 +109,7 @@ class BrazilianDocumentFormatter(DocumentFormatterInterface):
         >>> formatter.format_cnpj("12345678000195")
         '12.345.678/0001-95'
         """
-        if not cnpj or len(cnpj) != 14:
-            raise ValueError(f"CNPJ deve ter exatamente 14 dígitos, recebido: '{cnpj}'")
-
-        if not cnpj.isdigit():
-            raise ValueError(f"CNPJ deve conter apenas dígitos, recebido: '{cnpj}'")
-
-        return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:14]}"
+        return _format_cnpj(cnpj)
 
     def format_document(self, document: str) -> str:
         """
@@ -120,8 +141,7 @@ class BrazilianDocumentFormatter(DocumentFormatterInterface):
         if not document:
             return document
 
-        if len(document) == 11:
-            return self.format_cpf(document)
-        if len(document) == 14:
-            return self.format_cnpj(document)
+        formatter = self._formatters_by_length.get(len(document))
+        if formatter is not None:
+            return formatter(document)
         raise ValueError(f"Documento deve ter 11 (CPF) ou 14 (CNPJ) dígitos, recebido: '{document}' com {len(document)} dígitos")
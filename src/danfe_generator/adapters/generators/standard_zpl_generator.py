@@ -12,6 +12,41 @@ from ..formatters.brazilian_date_formatter import BrazilianDateFormatter
 from ..formatters.brazilian_document_formatter import BrazilianDocumentFormatter
 
 
+# Formatadores sem estado, compartilhados por todas as instâncias do gerador
+_DATE_FORMATTER = BrazilianDateFormatter()
+_DOC_FORMATTER = BrazilianDocumentFormatter()
+
+# Layout padrão da DANFE Simplificada; os campos variáveis são
+# preenchidos via str.format_map em StandardZPLGenerator.generate
+_ZPL_TEMPLATE = """^XA
+^CI28
+^MCY
+^FO30,20^GB265,130,3^FS
+^FO40,40^A0N,20,20^FD1 - Saida^FS
+^FO40,70^A0N,20,20^FH^FDNumero {numero}/Serie {serie}^FS
+^FO40,100^A0N,20,20^FH^FDEmissao {data_emissao}^FS
+^FO440,40^A0N,30,30^FDChave de acesso^FS
+^FO320,70^A0N,20,20^FD{chave_acesso}^FS
+^FO340,100^A0N,30,30^FH^FDProtocolo de Autorizacao de uso^FS
+^FO395,130^A0N,20,20^FD{protocolo_info}^FS
+^FO135,190^BY2,,0^BCN,150,Y,N,N^FD>;{chave_acesso}^FS
+^FO0,355^A0N,25,25^FB675,1,0,R^FD^FS
+^FO0,380^GB800,1,3^FS
+^FO40,400^A0N,20,20^FH^FDREMETENTE: {emit_nome}^FS
+^FO40,430^A0N,20,20^FDCNPJ: {emit_cnpj}^FS
+^FO310,430^A0N,20,20^FH^FDINSCRICAO ESTADUAL: {emit_ie}^FS
+^FO690,430^A0N,20,20^FDUF: {emit_uf}^FS
+^FO40,500^A0N,20,20^FH^FDDESTINATARIO: {dest_nome}^FS
+^FO40,530^A0N,20,20^FD{dest_tipo_doc}: {dest_doc}^FS
+^FO690,530^A0N,20,20^FDUF: {dest_uf}^FS
+^FO40,560^A0N,20,20^FDDANFE SIMPLIFICADO^FS
+^FO0,600^GB800,1,3^FS
+^FO0,1000^GB800,1,3^FS
+^FO40,1020^A0N,25,25^FDDADOS ADICIONAIS^FS
+^FO40,1050^A0N,20,20^FB740,8,3,L^FH^FD^FS
+^XZ"""
+
+
 class StandardZPLGeneratorConfig:
     """
     Configuração para o gerador padrão de código ZPL.
@@ -36,8 +71,8 @@ class StandardZPLGenerator(ZPLGeneratorInterface):
 
     def __init__(self):
         """Inicializa o gerador com formatadores padrão."""
-        self._date_formatter = BrazilianDateFormatter()
-        self._doc_formatter = BrazilianDocumentFormatter()
+        self._date_formatter = _DATE_FORMATTER
+        self._doc_formatter = _DOC_FORMATTER
         self.config = StandardZPLGeneratorConfig()
 
     def generate(self, nfe_data: NFeData) -> DANFE:
@@ -69,44 +104,37 @@ class StandardZPLGenerator(ZPLGeneratorInterface):
         if not isinstance(nfe_data, NFeData):
             raise ValueError("nfe_data deve ser uma instância de NFeData")
 
+        emitente = nfe_data.emitente
+        destinatario = nfe_data.destinatario
+        protocolo = nfe_data.protocolo
+
         # Formata dados para exibição
         data_emissao = self._date_formatter.format_date(nfe_data.data_emissao)
-        cnpj_formatado = self._doc_formatter.format_cnpj(nfe_data.emitente.cnpj)
-        doc_dest_formatado = self._doc_formatter.format_document(nfe_data.destinatario.documento) if self.config.cpf_dest else '-'
+        cnpj_formatado = self._doc_formatter.format_cnpj(emitente.cnpj)
+        doc_dest_formatado = self._doc_formatter.format_document(destinatario.documento) if self.config.cpf_dest else '-'
 
         # Formata protocolo se existir
         protocolo_info = ""
-        if nfe_data.protocolo:
-            data_autorizacao = self._date_formatter.format_datetime(nfe_data.protocolo.data_autorizacao)
-            protocolo_info = f"{nfe_data.protocolo.numero} {data_autorizacao}"
+        if protocolo:
+            data_autorizacao = self._date_formatter.format_datetime(protocolo.data_autorizacao)
+            protocolo_info = f"{protocolo.numero} {data_autorizacao}"
 
-        # Gera código ZPL baseado no padrão estabelecido
-        zpl_code = f"""^XA
-^CI28
-^MCY
-^FO30,20^GB265,130,3^FS
-^FO40,40^A0N,20,20^FD1 - Saida^FS
-^FO40,70^A0N,20,20^FH^FDNumero {nfe_data.numero}/Serie {nfe_data.serie}^FS
-^FO40,100^A0N,20,20^FH^FDEmissao {data_emissao}^FS
-^FO440,40^A0N,30,30^FDChave de acesso^FS
-^FO320,70^A0N,20,20^FD{nfe_data.chave_acesso}^FS
-^FO340,100^A0N,30,30^FH^FDProtocolo de Autorizacao de uso^FS
-^FO395,130^A0N,20,20^FD{protocolo_info}^FS
-^FO135,190^BY2,,0^BCN,150,Y,N,N^FD>;{nfe_data.chave_acesso}^FS
-^FO0,355^A0N,25,25^FB675,1,0,R^FD^FS
-^FO0,380^GB800,1,3^FS
-^FO40,400^A0N,20,20^FH^FDREMETENTE: {nfe_data.emitente.nome}^FS
-^FO40,430^A0N,20,20^FDCNPJ: {cnpj_formatado}^FS
-^FO310,430^A0N,20,20^FH^FDINSCRICAO ESTADUAL: {nfe_data.emitente.inscricao_estadual}^FS
-^FO690,430^A0N,20,20^FDUF: {nfe_data.emitente.uf}^FS
-^FO40,500^A0N,20,20^FH^FDDESTINATARIO: {nfe_data.destinatario.nome}^FS
-^FO40,530^A0N,20,20^FD{nfe_data.destinatario.tipo_documento.value}: {doc_dest_formatado}^FS
-^FO690,530^A0N,20,20^FDUF: {nfe_data.destinatario.uf}^FS
-^FO40,560^A0N,20,20^FDDANFE SIMPLIFICADO^FS
-^FO0,600^GB800,1,3^FS
-^FO0,1000^GB800,1,3^FS
-^FO40,1020^A0N,25,25^FDDADOS ADICIONAIS^FS
-^FO40,1050^A0N,20,20^FB740,8,3,L^FH^FD^FS
-^XZ"""
+        # Preenche o template ZPL padrão com os campos formatados
+        zpl_code = _ZPL_TEMPLATE.format_map({
+            'numero': nfe_data.numero,
+            'serie': nfe_data.serie,
+            'data_emissao': data_emissao,
+            'chave_acesso': nfe_data.chave_acesso,
+            'protocolo_info': protocolo_info,
+            'emit_nome': emitente.nome,
+            'emit_cnpj': cnpj_formatado,
+            'emit_ie': emitente.inscricao_estadual,
+            'emit_uf': emitente.uf,
+            'dest_nome': destinatario.nome,
+            'dest_tipo_doc': destinatario.tipo_documento.value,
+            'dest_doc': doc_dest_formatado,
+            'dest_uf': destinatario.uf,
+        })
 
-        return DANFE(nfe_data=nfe_data, codigo_zpl=zpl_code)
+        # nfe_data já foi verificado acima e o template começa em ^XA e termina em ^XZ
+        return DANFE._unchecked(nfe_data, zpl_code)
@@ -5,11 +5,24 @@ Este módulo implementa o parser responsável por extrair
 dados de arquivos XML da NFe seguindo o padrão SEFAZ.
 """
 
-import xml.etree.ElementTree as ET
+import copy
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Union, Optional
+from operator import methodcaller
+from typing import Callable, Iterable, List, Union, Optional
 from pathlib import Path
 
+try:
+    from lxml import etree as ET
+    _LXML_DISPONIVEL = True
+except ImportError:  # lxml é opcional; usa o parser da biblioteca padrão
+    import xml.etree.ElementTree as ET
+    _LXML_DISPONIVEL = False
+
 from ...domain.entities.nfe_data import NFeData
 from ...domain.entities.emitente import Emitente
 from ...domain.entities.destinatario import Destinatario, TipoDocumento
@@ -17,6 +30,135 @@ from ...domain.entities.protocolo import Protocolo
 from ...domain.interfaces.nfe_parser import NFeParserInterface
 
 
+_NFE_NS = 'http://www.portalfiscal.inf.br/nfe'
+_DS_NS = 'http://www.w3.org/2000/09/xmldsig#'
+
+# Tags e caminhos em notação de Clark, resolvidos uma única vez no import
+_TAG_NFE = f'{{{_NFE_NS}}}NFe'
+_TAG_INF_NFE = f'{{{_NFE_NS}}}infNFe'
+_TAG_IDE = f'{{{_NFE_NS}}}ide'
+_TAG_N_NF = f'{{{_NFE_NS}}}nNF'
+_TAG_SERIE = f'{{{_NFE_NS}}}serie'
+_TAG_DH_EMI = f'{{{_NFE_NS}}}dhEmi'
+_TAG_EMIT = f'{{{_NFE_NS}}}emit'
+_TAG_CNPJ = f'{{{_NFE_NS}}}CNPJ'
+_TAG_X_NOME = f'{{{_NFE_NS}}}xNome'
+_TAG_X_FANT = f'{{{_NFE_NS}}}xFant'
+_TAG_IE = f'{{{_NFE_NS}}}IE'
+_TAG_ENDER_EMIT = f'{{{_NFE_NS}}}enderEmit'
+_TAG_DEST = f'{{{_NFE_NS}}}dest'
+_TAG_CPF = f'{{{_NFE_NS}}}CPF'
+_TAG_ENDER_DEST = f'{{{_NFE_NS}}}enderDest'
+_TAG_UF = f'{{{_NFE_NS}}}UF'
+_TAG_PROT_NFE = f'{{{_NFE_NS}}}protNFe'
+_TAG_INF_PROT = f'{{{_NFE_NS}}}infProt'
+_TAG_N_PROT = f'{{{_NFE_NS}}}nProt'
+_TAG_DH_RECBTO = f'{{{_NFE_NS}}}dhRecbto'
+_PATH_NFE_INF_NFE = f'{_TAG_NFE}/{_TAG_INF_NFE}'
+_PATH_PROT_NFE_INF_PROT = f'{_TAG_PROT_NFE}/{_TAG_INF_PROT}'
+
+
+def _compile_path(path: str) -> Callable[[ET.Element], Optional[ET.Element]]:
+    """
+    Compila um caminho em notação de Clark em uma função de busca.
+    
+    Com lxml, o caminho é compilado uma única vez como ``ETXPath``;
+    com o ElementTree padrão, a busca é delegada a ``find``, que já
+    mantém cache dos caminhos compilados.
+    
+    Parameters
+    ----------
+    path : str
+        Caminho relativo em notação de Clark (ex: ``{ns}ide/{ns}nNF``)
+    
+    Returns
+    -------
+    Callable[[ET.Element], Optional[ET.Element]]
+        Função que recebe o elemento de contexto e retorna o primeiro
+        elemento encontrado ou None
+    """
+    if _LXML_DISPONIVEL:
+        xpath = ET.ETXPath(path)
+
+        def find_first(elem):
+            result = xpath(elem)
+            return result[0] if result else None
+
+        return find_first
+    return methodcaller('find', path)
+
+
+def _read_fields(parent: ET.Element, spec: dict) -> dict:
+    """
+    Lê em uma única passada os filhos de ``parent`` descritos em ``spec``.
+    
+    Parameters
+    ----------
+    parent : ET.Element
+        Elemento cujos filhos serão percorridos
+    spec : dict
+        Mapeamento de tag (notação de Clark) para o nome do campo ou,
+        para grupos aninhados (ex: ``enderEmit``), para outro mapeamento
+    
+    Returns
+    -------
+    dict
+        Texto de cada campo encontrado (vazio se sem conteúdo), indexado
+        pelo nome do campo; o primeiro elemento de cada tag prevalece
+    """
+    fields = {}
+    for child in parent:
+        key = spec.get(child.tag)
+        if key is None:
+            continue
+        if isinstance(key, dict):
+            for nested_key, value in _read_fields(child, key).items():
+                fields.setdefault(nested_key, value)
+        elif key not in fields:
+            fields[key] = child.text or ""
+    return fields
+
+
+# Buscas da NFe compiladas no import
+_FIND_NFE_INF_NFE = _compile_path(_PATH_NFE_INF_NFE)
+_FIND_INF_NFE = _compile_path(_TAG_INF_NFE)
+_FIND_IDE = _compile_path(_TAG_IDE)
+_FIND_EMIT = _compile_path(_TAG_EMIT)
+_FIND_DEST = _compile_path(_TAG_DEST)
+_FIND_PROT_NFE_INF_PROT = _compile_path(_PATH_PROT_NFE_INF_PROT)
+_FIND_N_PROT = _compile_path(_TAG_N_PROT)
+_FIND_DH_RECBTO = _compile_path(_TAG_DH_RECBTO)
+
+# Campos lidos em uma única varredura de ide/emit/dest (tag -> campo ou subgrupo)
+_CAMPOS_ENDER = {_TAG_UF: 'uf'}
+_CAMPOS_IDE = {_TAG_N_NF: 'numero', _TAG_SERIE: 'serie', _TAG_DH_EMI: 'data_emissao'}
+_CAMPOS_EMIT = {_TAG_CNPJ: 'cnpj', _TAG_X_NOME: 'nome', _TAG_X_FANT: 'fantasia', _TAG_IE: 'ie',
+                _TAG_ENDER_EMIT: _CAMPOS_ENDER}
+_CAMPOS_DEST = {_TAG_CPF: 'cpf', _TAG_CNPJ: 'cnpj', _TAG_X_NOME: 'nome',
+                _TAG_ENDER_DEST: _CAMPOS_ENDER}
+
+# Grupos da NFe que não são utilizados pelo DANFE Simplificado e podem
+# ser descartados durante a leitura (os itens em <det> dominam o documento)
+_TAGS_DESCARTAVEIS = frozenset(
+    [f'{{{_NFE_NS}}}{tag}' for tag in ('det', 'total', 'transp', 'cobr', 'pag', 'infAdic')]
+    + [f'{{{_DS_NS}}}Signature']
+)
+
+# Opções do parser libxml2 (ignoradas pelo ElementTree da biblioteca padrão):
+# sem espaços entre tags, comentários, índice de IDs, entidades nem acesso à rede
+_ITERPARSE_OPTIONS = (
+    {'huge_tree': False, 'remove_blank_text': True, 'remove_comments': True,
+     'collect_ids': False, 'resolve_entities': False, 'no_network': True}
+    if _LXML_DISPONIVEL else {}
+)
+
+# Buffer de leitura amplo: em compartilhamentos SMB cada leitura é uma ida e volta na rede
+_READ_BUFFER_SIZE = 256 * 1024
+
+# Abaixo deste número de arquivos, o custo de subir processos supera o ganho
+_PARSE_MANY_MIN_PARALELO = 8
+
+
 class XMLNFeParser(NFeParserInterface):
     """
     Parser para arquivos XML da NFe.
@@ -32,9 +174,20 @@ class XMLNFeParser(NFeParserInterface):
     123
     """
 
-    def __init__(self):
-        """Inicializa o parser XML."""
-        self._namespace = {'nfe': 'http://www.portalfiscal.inf.br/nfe'}
+    def __init__(self, cache_size: int = 0):
+        """
+        Inicializa o parser, opcionalmente com cache dos resultados por arquivo.
+        
+        Parameters
+        ----------
+        cache_size : int, optional
+            Número máximo de NFes mantidas em cache; indicado para processos
+            que leem o mesmo XML várias vezes. 0 desativa o cache, evitando
+            o stat e a cópia extras por leitura (default: 0)
+        """
+        self._cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def parse(self, source: Union[str, Path]) -> NFeData:
         """
@@ -65,18 +218,33 @@ class XMLNFeParser(NFeParserInterface):
         Empresa Exemplo LTDA
         """
         try:
-            # Parse do XML
-            tree = ET.parse(source)
-            root = tree.getroot()
+            # Arquivo inalterado (mesmo caminho absoluto, inode, mtime e tamanho)
+            # reaproveita o resultado; o cache entrega sempre uma cópia, pois
+            # as entidades são mutáveis
+            if self._cache_size > 0:
+                st = os.stat(source)
+                key = (os.path.abspath(source), st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+                with self._cache_lock:
+                    nfe_data = self._cache.get(key)
+                    if nfe_data is not None:
+                        self._cache.move_to_end(key)
+                if nfe_data is not None:
+                    return _copy_nfe_data(nfe_data)
+
+            # Leitura do XML em passagem única
+            root = self._read_tree(source)
+
+            # Localiza infNFe uma única vez; os demais grupos são filhos diretos
+            inf_nfe = self._find_inf_nfe(root)
 
             # Extrai dados principais
-            identificacao = self._extract_identificacao(root)
-            emitente = self._extract_emitente(root)
-            destinatario = self._extract_destinatario(root)
+            identificacao = self._extract_identificacao(inf_nfe)
+            emitente = self._extract_emitente(inf_nfe)
+            destinatario = self._extract_destinatario(inf_nfe)
             protocolo = self._extract_protocolo(root)
 
             # Monta objeto NFeData
-            return NFeData(
+            nfe_data = NFeData(
                 numero=identificacao['numero'],
                 serie=identificacao['serie'],
                 chave_acesso=identificacao['chave_acesso'],
@@ -86,7 +254,15 @@ class XMLNFeParser(NFeParserInterface):
                 protocolo=protocolo
             )
 
+            if self._cache_size > 0:
+                with self._cache_lock:
+                    self._cache[key] = _copy_nfe_data(nfe_data)
+                    if len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+            return nfe_data
+
         except ET.ParseError as e:
+            # Em lxml, XMLSyntaxError é subclasse de ParseError
             raise ValueError(f"XML malformado: {e}") from e
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Arquivo XML não encontrado: {source}") from e
@@ -99,9 +275,90 @@ class XMLNFeParser(NFeParserInterface):
         except Exception as e:
             raise ValueError(f"Erro ao processar XML da NFe: {e}") from e
 
-    def _extract_identificacao(self, root: ET.Element) -> dict:
+    def parse_many(self, sources: Iterable[Union[str, Path]],
+                   workers: Optional[int] = None) -> List[NFeData]:
         """
-        Extrai dados de identificação da NFe.
+        Extrai os dados de vários XMLs, distribuindo o trabalho entre processos.
+        
+        Lotes pequenos (menos de 8 arquivos, ou um único processo) são
+        processados sequencialmente, pois o custo de iniciar os processos
+        dominaria o tempo total; os demais são divididos em cerca de 4
+        lotes por processo.
+        
+        Parameters
+        ----------
+        sources : Iterable[Union[str, Path]]
+            Caminhos para os arquivos XML da NFe
+        workers : Optional[int], optional
+            Número de processos (default: os.cpu_count())
+        
+        Returns
+        -------
+        List[NFeData]
+            Dados estruturados das NFes, na ordem recebida
+        
+        Raises
+        ------
+        ValueError
+            Se algum XML não for válido ou estiver malformado
+        FileNotFoundError
+            Se algum arquivo não for encontrado
+        
+        Examples
+        --------
+        >>> parser = XMLNFeParser()
+        >>> notas = parser.parse_many(["nfe1.xml", "nfe2.xml"])
+        >>> print(len(notas))
+        2
+        """
+        sources = list(sources)
+        workers = min(workers or os.cpu_count() or 1, len(sources))
+        if len(sources) < _PARSE_MANY_MIN_PARALELO or workers < 2:
+            return [self.parse(source) for source in sources]
+
+        # Cerca de 4 lotes por processo: amortiza o envio entre processos
+        # sem deixar processos ociosos em lotes pequenos
+        chunksize = max(1, len(sources) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_one, sources, chunksize=chunksize))
+
+    def _read_tree(self, source: Union[str, Path]) -> ET.Element:
+        """
+        Lê o XML em uma única passagem, materializando apenas os grupos usados.
+        
+        Os itens da nota (``det``), totais, transporte, cobrança, pagamento,
+        informações adicionais e assinatura são descartados assim que lidos,
+        e a leitura termina ao fim do protocolo de autorização.
+        
+        Parameters
+        ----------
+        source : Union[str, Path]
+            Caminho para o arquivo XML da NFe
+        
+        Returns
+        -------
+        ET.Element
+            Elemento raiz do XML, sem os grupos descartados
+        """
+        root = None
+        with open(source, 'rb', buffering=_READ_BUFFER_SIZE) as xml_file:
+            for event, elem in ET.iterparse(xml_file, events=('start', 'end'), **_ITERPARSE_OPTIONS):
+                if root is None:
+                    root = elem
+                elif event == 'end':
+                    if elem.tag in _TAGS_DESCARTAVEIS:
+                        elem.clear()
+                    elif elem.tag == _TAG_INF_PROT:  # último grupo lido
+                        break
+        return root
+
+    def _find_inf_nfe(self, root: ET.Element) -> ET.Element:
+        """
+        Localiza o elemento infNFe navegando pela estrutura fixa da NFe.
+        
+        Aceita tanto o XML distribuído (``nfeProc/NFe/infNFe``) quanto
+        a NFe sem protocolo (``NFe/infNFe``), evitando a busca por
+        descendentes em todo o documento.
         
         Parameters
         ----------
@@ -110,119 +367,134 @@ class XMLNFeParser(NFeParserInterface):
         
         Returns
         -------
-        dict
-            Dados de identificação extraídos
+        ET.Element
+            Elemento infNFe
+        
+        Raises
+        ------
+        ValueError
+            Se o elemento infNFe não for encontrado
         """
-        ide = root.find('.//nfe:ide', self._namespace)
-        if ide is None:
-            raise ValueError("Elemento 'ide' não encontrado no XML")
+        inf_nfe = _FIND_NFE_INF_NFE(root)
+        if inf_nfe is None:
+            inf_nfe = _FIND_INF_NFE(root)
+        if inf_nfe is None:
+            raise ValueError("Elemento 'infNFe' não encontrado no XML")
+        return inf_nfe
 
-        numero_elem = ide.find('nfe:nNF', self._namespace)
-        serie_elem = ide.find('nfe:serie', self._namespace)
-        data_elem = ide.find('nfe:dhEmi', self._namespace)
+    def _find_group(self, inf_nfe: ET.Element,
+                    find: Callable[[ET.Element], Optional[ET.Element]], nome: str) -> ET.Element:
+        """
+        Localiza um grupo obrigatório de infNFe (ide, emit, dest).
+        
+        Parameters
+        ----------
+        inf_nfe : ET.Element
+            Elemento infNFe do XML
+        find : Callable[[ET.Element], Optional[ET.Element]]
+            Busca compilada por ``_compile_path``
+        nome : str
+            Nome do grupo, usado na mensagem de erro
+        
+        Returns
+        -------
+        ET.Element
+            Elemento do grupo
+        
+        Raises
+        ------
+        ValueError
+            Se o grupo não for encontrado
+        """
+        group = find(inf_nfe)
+        if group is None:
+            raise ValueError(f"Elemento '{nome}' não encontrado no XML")
+        return group
 
-        numero = numero_elem.text if numero_elem is not None else ""
-        serie = serie_elem.text if serie_elem is not None else ""
-        data_emissao_str = data_elem.text if data_elem is not None else ""
+    def _extract_identificacao(self, inf_nfe: ET.Element) -> dict:
+        """
+        Extrai dados de identificação da NFe.
+        
+        Parameters
+        ----------
+        inf_nfe : ET.Element
+            Elemento infNFe do XML
+        
+        Returns
+        -------
+        dict
+            Dados de identificação extraídos
+        """
+        fields = _read_fields(self._find_group(inf_nfe, _FIND_IDE, 'ide'), _CAMPOS_IDE)
 
         # Converte data de emissão
-        data_emissao = self._parse_iso_datetime(data_emissao_str)
-
-        # Extrai chave de acesso
-        inf_nfe = root.find('.//nfe:infNFe', self._namespace)
-        if inf_nfe is None:
-            raise ValueError("Elemento 'infNFe' não encontrado no XML")
+        data_emissao = self._parse_iso_datetime(fields.get('data_emissao', ""))
 
+        # Extrai chave de acesso do atributo Id ("NFe" + 44 dígitos)
         chave_completa = inf_nfe.get('Id', '')
-        chave_acesso = chave_completa.replace('NFe', '') if chave_completa else ""
+        chave_acesso = chave_completa[3:] if chave_completa.startswith('NFe') else chave_completa
 
         return {
-            'numero': numero,
-            'serie': serie,
+            'numero': fields.get('numero', ""),
+            'serie': fields.get('serie', ""),
             'data_emissao': data_emissao,
             'chave_acesso': chave_acesso
         }
 
-    def _extract_emitente(self, root: ET.Element) -> Emitente:
+    def _extract_emitente(self, inf_nfe: ET.Element) -> Emitente:
         """
         Extrai dados do emitente.
         
         Parameters
         ----------
-        root : ET.Element
-            Elemento raiz do XML
+        inf_nfe : ET.Element
+            Elemento infNFe do XML
         
         Returns
         -------
         Emitente
             Dados do emitente
         """
-        emit = root.find('.//nfe:emit', self._namespace)
-        if emit is None:
-            raise ValueError("Elemento 'emit' não encontrado no XML")
-
-        cnpj_elem = emit.find('nfe:CNPJ', self._namespace)
-        nome_elem = emit.find('nfe:xNome', self._namespace)
-        fantasia_elem = emit.find('nfe:xFant', self._namespace)
-        ie_elem = emit.find('nfe:IE', self._namespace)
-        uf_elem = emit.find('.//nfe:UF', self._namespace)
-
-        cnpj = cnpj_elem.text if cnpj_elem is not None else ""
-        nome = nome_elem.text if nome_elem is not None else ""
-        fantasia = fantasia_elem.text if fantasia_elem is not None else None
-        ie = ie_elem.text if ie_elem is not None else ""
-        uf = uf_elem.text if uf_elem is not None else ""
+        fields = _read_fields(self._find_group(inf_nfe, _FIND_EMIT, 'emit'), _CAMPOS_EMIT)
 
+        # Dados do emitente se repetem entre as NFes de um lote: interna as strings
         return Emitente(
-            cnpj=cnpj,
-            nome=nome,
-            fantasia=fantasia,
-            inscricao_estadual=ie,
-            uf=uf
+            cnpj=sys.intern(fields.get('cnpj', "")),
+            nome=sys.intern(fields.get('nome', "")),
+            fantasia=fields.get('fantasia') or None,
+            inscricao_estadual=sys.intern(fields.get('ie', "")),
+            uf=sys.intern(fields.get('uf', ""))
         )
 
-    def _extract_destinatario(self, root: ET.Element) -> Destinatario:
+    def _extract_destinatario(self, inf_nfe: ET.Element) -> Destinatario:
         """
         Extrai dados do destinatário.
         
         Parameters
         ----------
-        root : ET.Element
-            Elemento raiz do XML
+        inf_nfe : ET.Element
+            Elemento infNFe do XML
         
         Returns
         -------
         Destinatario
             Dados do destinatário
         """
-        dest = root.find('.//nfe:dest', self._namespace)
-        if dest is None:
-            raise ValueError("Elemento 'dest' não encontrado no XML")
-
-        cpf_elem = dest.find('nfe:CPF', self._namespace)
-        cnpj_elem = dest.find('nfe:CNPJ', self._namespace)
-        nome_elem = dest.find('nfe:xNome', self._namespace)
-        uf_elem = dest.find('.//nfe:UF', self._namespace)
+        fields = _read_fields(self._find_group(inf_nfe, _FIND_DEST, 'dest'), _CAMPOS_DEST)
 
         # Determina tipo e valor do documento
-        if cpf_elem is not None:
-            documento = cpf_elem.text
-            tipo_documento = TipoDocumento.CPF
-        elif cnpj_elem is not None:
-            documento = cnpj_elem.text
-            tipo_documento = TipoDocumento.CNPJ
-        else:
-            documento = ""
-            tipo_documento = TipoDocumento.CPF  # Default
-
-        nome = nome_elem.text if nome_elem is not None else ""
-        uf = uf_elem.text if uf_elem is not None else ""
+        documento = fields.get('cpf', "")
+        tipo_documento = TipoDocumento.CPF
+        if not documento:
+            documento = fields.get('cnpj', "")
+            if documento:
+                tipo_documento = TipoDocumento.CNPJ
 
         return Destinatario(
             documento=documento,
             tipo_documento=tipo_documento,
-            nome=nome,
-            uf=uf
+            nome=fields.get('nome', ""),
+            uf=sys.intern(fields.get('uf', ""))
         )
 
     def _extract_protocolo(self, root: ET.Element) -> Optional[Protocolo]:
@@ -239,12 +511,12 @@ class XMLNFeParser(NFeParserInterface):
         Optional[Protocolo]
             Dados do protocolo ou None se não encontrado
         """
-        prot = root.find('.//nfe:protNFe/nfe:infProt', self._namespace)
+        prot = _FIND_PROT_NFE_INF_PROT(root)
         if prot is None:
             return None
 
-        prot_num_elem = prot.find('nfe:nProt', self._namespace)
-        prot_data_elem = prot.find('nfe:dhRecbto', self._namespace)
+        prot_num_elem = _FIND_N_PROT(prot)
+        prot_data_elem = _FIND_DH_RECBTO(prot)
 
         if prot_num_elem is None or prot_data_elem is None:
             return None
@@ -272,13 +544,54 @@ class XMLNFeParser(NFeParserInterface):
             Objeto datetime correspondente
         """
         try:
-            # Remove timezone se presente
-            datetime_part = iso_datetime.split('-03:00')[0] if '-03:00' in iso_datetime else iso_datetime
-
-            if 'T' in datetime_part:
-                return datetime.strptime(datetime_part, '%Y-%m-%dT%H:%M:%S')
-            date_part = datetime_part.split('T')[0]
-            return datetime.strptime(date_part, '%Y-%m-%d')
+            # Formato fixo AAAA-MM-DD[THH:MM:SS][±HH:MM]: corta por posição,
+            # descartando o fuso horário sem varrer a string
+            if iso_datetime[10:11] != 'T':
+                # Só a data (com ou sem fuso): meia-noite do dia
+                return datetime.fromisoformat(iso_datetime[:10])
+            return datetime.fromisoformat(iso_datetime[:19])
         except ValueError:
             # Se não conseguir fazer parse, retorna data atual
             return datetime.now()
+
+
+def _copy_nfe_data(nfe_data: NFeData) -> NFeData:
+    """
+    Copia o NFeData e as entidades aninhadas, isolando o cache de quem o usa.
+    
+    Os demais campos (str, datetime, TipoDocumento) são imutáveis e
+    podem ser compartilhados entre as cópias.
+    
+    Parameters
+    ----------
+    nfe_data : NFeData
+        Dados da NFe a copiar
+    
+    Returns
+    -------
+    NFeData
+        Cópia independente dos dados da NFe
+    """
+    copia = copy.copy(nfe_data)
+    copia.emitente = copy.copy(nfe_data.emitente)
+    copia.destinatario = copy.copy(nfe_data.destinatario)
+    if nfe_data.protocolo is not None:
+        copia.protocolo = copy.copy(nfe_data.protocolo)
+    return copia
+
+
+def _parse_one(source: Union[str, Path]) -> NFeData:
+    """
+    Extrai os dados de um único XML (executado nos processos de parse_many).
+    
+    Parameters
+    ----------
+    source : Union[str, Path]
+        Caminho para o arquivo XML da NFe
+    
+    Returns
+    -------
+    NFeData
+        Dados estruturados da NFe
+    """
+    return XMLNFeParser().parse(source)
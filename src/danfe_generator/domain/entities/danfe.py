@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from .nfe_data import NFeData
 
 
-@dataclass
+@dataclass(slots=True)
 class DANFE:
     """
     Representa um DANFE Simplificado.
@@ -43,7 +43,7 @@ class DANFE:
         ValueError
             Se algum campo obrigatório estiver vazio ou inválido
         """
-        if not isinstance(self.nfe_data, NFeData):
+        if __debug__ and not isinstance(self.nfe_data, NFeData):
             raise ValueError("nfe_data deve ser uma instância de NFeData")
 
         if not self.codigo_zpl:
@@ -55,6 +55,31 @@ class DANFE:
         if not self.codigo_zpl.endswith('^XZ'):
             raise ValueError("Código ZPL deve terminar com ^XZ")
 
+    @classmethod
+    def _unchecked(cls, nfe_data: NFeData, codigo_zpl: str) -> 'DANFE':
+        """
+        Cria o DANFE sem executar as validações de ``__post_init__``.
+        
+        Uso interno, restrito a geradores que já garantem um ``NFeData``
+        válido e um código ZPL delimitado por ^XA/^XZ.
+        
+        Parameters
+        ----------
+        nfe_data : NFeData
+            Dados da NFe que originou este DANFE
+        codigo_zpl : str
+            Código ZPL gerado para impressão da etiqueta
+        
+        Returns
+        -------
+        DANFE
+            DANFE construído sem validação
+        """
+        danfe = object.__new__(cls)
+        danfe.nfe_data = nfe_data
+        danfe.codigo_zpl = codigo_zpl
+        return danfe
+
     def save_to_file(self, file_path: str) -> None:
         """
         Salva o código ZPL em um arquivo.
@@ -74,8 +99,8 @@ class DANFE:
         >>> danfe.save_to_file("minha_danfe.zpl")
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(self.codigo_zpl)
+            with open(file_path, 'wb') as f:
+                f.write(self.codigo_zpl.encode('utf-8'))
         except Exception as e:
             raise IOError(f"Erro ao salvar arquivo: {e}") from e
 
@@ -25,7 +25,7 @@ class TipoDocumento(Enum):
     CNPJ = "CNPJ"
 
 
-@dataclass
+@dataclass(slots=True)
 class Destinatario:
     """
     Representa o destinatário de uma NFe.
@@ -14,7 +14,7 @@ from .destinatario import Destinatario
 from .protocolo import Protocolo
 
 
-@dataclass
+@dataclass(slots=True)
 class NFeData:
     """
     Representa os dados principais de uma NFe.
@@ -83,7 +83,7 @@ class NFeData:
         if not self.chave_acesso or len(self.chave_acesso) != 44:
             raise ValueError("Chave de acesso deve ter exatamente 44 dígitos")
 
-        if not isinstance(self.data_emissao, datetime):
+        if __debug__ and not isinstance(self.data_emissao, datetime):
             raise ValueError("Data de emissão deve ser um objeto datetime")
 
     def get_data_emissao_formatada(self) -> str:
@@ -101,7 +101,8 @@ class NFeData:
         >>> nfe.get_data_emissao_formatada()
         '01/09/2025'
         """
-        return self.data_emissao.strftime('%d/%m/%Y')
+        d = self.data_emissao
+        return f"{d.day:02d}/{d.month:02d}/{d.year:04d}"
 
     def get_chave_formatada(self) -> str:
         """
@@ -118,6 +119,7 @@ class NFeData:
         >>> nfe.get_chave_formatada()
         '1234 5678 9012 3456 7890 1234 5678 9012 3456 7890 123'
         """
-        # Formata a chave em grupos de 4 dígitos
-        grupos = [self.chave_acesso[i:i+4] for i in range(0, len(self.chave_acesso), 4)]
-        return ' '.join(grupos)
+        # Formata a chave (44 dígitos, validada em __post_init__) em 11 grupos de 4
+        c = self.chave_acesso
+        return (f"{c[0:4]} {c[4:8]} {c[8:12]} {c[12:16]} {c[16:20]} {c[20:24]} "
+                f"{c[24:28]} {c[28:32]} {c[32:36]} {c[36:40]} {c[40:44]}")
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Protocolo:
     """
     Representa o protocolo de autorização de uma NFe.
@@ -51,7 +51,7 @@ class Protocolo:
         if not self.numero:
             raise ValueError("Número do protocolo é obrigatório")
 
-        if not isinstance(self.data_autorizacao, datetime):
+        if __debug__ and not isinstance(self.data_autorizacao, datetime):
             raise ValueError("Data de autorização deve ser um objeto datetime")
 
     def get_data_formatada(self) -> str:
@@ -69,4 +69,5 @@ class Protocolo:
         >>> protocolo.get_data_formatada()
         '01/09/2025 08:55:05'
         """
-        return self.data_autorizacao.strftime('%d/%m/%Y %H:%M:%S')
+        d = self.data_autorizacao
+        return f"{d.day:02d}/{d.month:02d}/{d.year:04d} {d.hour:02d}:{d.minute:02d}:{d.second:02d}"
@@ -6,7 +6,7 @@ gerenciam a escrita de arquivos no sistema de arquivos.
 """
 
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Iterable, Tuple, Union
 from pathlib import Path
 
 
@@ -17,23 +17,30 @@ class FileWriterInterface(ABC):
     Define o contrato que deve ser implementado por classes
     responsáveis por escrever conteúdo em arquivos.
     
+    O conteúdo recebido por ``write``, ``write_many`` e ``write_concat``
+    pode ser ``str`` ou ``bytes`` (por exemplo, ZPL já codificado por quem
+    chama). Implementações próprias devem gravar ``bytes`` sem conversão
+    e codificar ``str`` em UTF-8.
+    
     Examples
     --------
     >>> class TextFileWriter(FileWriterInterface):
     ...     def write(self, content, file_path):
+    ...         if isinstance(content, str):
+    ...             content = content.encode('utf-8')
     ...         # Implementação específica
-    ...         pass
     """
 
     @abstractmethod
-    def write(self, content: str, file_path: Union[str, Path]) -> None:
+    def write(self, content: Union[str, bytes], file_path: Union[str, Path]) -> None:
         """
         Escreve conteúdo em um arquivo.
         
         Parameters
         ----------
-        content : str
-            Conteúdo a ser escrito
+        content : Union[str, bytes]
+            Conteúdo a ser escrito; ``str`` é codificado em UTF-8 e
+            ``bytes`` é gravado sem conversão
         file_path : Union[str, Path]
             Caminho do arquivo de destino
         
@@ -46,6 +53,62 @@ class FileWriterInterface(ABC):
         """
         pass
 
+    def write_many(self, items: Iterable[Tuple[Union[str, bytes], Union[str, Path]]]) -> None:
+        """
+        Escreve vários arquivos de uma vez.
+        
+        A implementação padrão grava um arquivo por vez; implementações
+        podem sobrescrever este método para manter várias escritas em curso.
+        
+        Parameters
+        ----------
+        items : Iterable[Tuple[Union[str, bytes], Union[str, Path]]]
+            Pares (conteúdo, caminho do arquivo de destino)
+        
+        Raises
+        ------
+        IOError
+            Se houver erro ao escrever algum arquivo
+        PermissionError
+            Se não houver permissão para escrever no local
+        """
+        for content, file_path in items:
+            self.write(content, file_path)
+
+    def write_concat(
+        self,
+        contents: Iterable[Union[str, bytes]],
+        file_path: Union[str, Path]
+    ) -> None:
+        """
+        Escreve vários conteúdos em sequência em um único arquivo.
+        
+        A implementação padrão junta os conteúdos (``str`` codificado em
+        UTF-8) e faz uma única chamada a ``write``; implementações podem
+        sobrescrever este método para gravar os conteúdos sem copiá-los.
+        
+        Parameters
+        ----------
+        contents : Iterable[Union[str, bytes]]
+            Conteúdos a serem escritos, na ordem desejada
+        file_path : Union[str, Path]
+            Caminho do arquivo de destino
+        
+        Raises
+        ------
+        IOError
+            Se houver erro ao escrever o arquivo
+        PermissionError
+            Se não houver permissão para escrever no local
+        """
+        self.write(
+            b''.join(
+                content.encode('utf-8') if isinstance(content, str) else content
+                for content in contents
+            ),
+            file_path
+        )
+
     @abstractmethod
     def exists(self, file_path: Union[str, Path]) -> bool:
         """
@@ -6,7 +6,11 @@ simplificada para o sistema de geração de DANFE seguindo os
 princípios da Clean Architecture.
 """
 
-from typing import Union, Optional
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterable, List, Optional, Union
 from pathlib import Path
 
 from .domain.entities.danfe import DANFE
@@ -19,6 +23,16 @@ from .use_cases.search_file_xml import SearchFileXMLUseCase
 from .infrastructure.file_sytem_search_xml import FileSystemSearchXMLConfig
 
 
+# Serviços compartilhados por todas as instâncias da facade do processo;
+# ver a nota na docstring de DANFEGeneratorFacade
+_XML_PARSER = XMLNFeParser()
+_FILE_WRITER = FileSystemWriter()
+_SAVE_USE_CASE = SaveDANFEToFileUseCase(_FILE_WRITER)
+
+# Abaixo deste número de arquivos, o custo de subir processos supera o ganho
+_GENERATE_BATCH_MIN_PARALELO = 8
+
+
 class DANFEGeneratorFacade:
     """
     Facade para o gerador de DANFE.
@@ -27,6 +41,14 @@ class DANFEGeneratorFacade:
     de arquivos XML da NFe, encapsulando a complexidade das camadas
     internas da Clean Architecture.
     
+    O parser de XML, o escritor de arquivos e o caso de uso de
+    salvamento são compartilhados por todas as instâncias do processo,
+    inclusive entre threads do chamador. O parser é usado sem
+    cache e o escritor recria diretórios de saída removidos, de modo que
+    nenhuma instância interfere nas demais.
+    O gerador de ZPL, cuja configuração é mutável, e a busca de XMLs
+    são criados por instância.
+    
     Parameters
     ----------
     xml_file_path : Union[str, Path]
@@ -61,10 +83,11 @@ class DANFEGeneratorFacade:
         self.cod_invoice = cod_invoice
         self._danfe = None
 
-        # Inicializa dependências
-        self._xml_parser = XMLNFeParser()
+        # Reutiliza as dependências compartilhadas; o gerador tem configuração
+        # própria e a busca depende do mês corrente
+        self._xml_parser = _XML_PARSER
         self._zpl_generator = StandardZPLGenerator()
-        self._file_writer = FileSystemWriter()
+        self._file_writer = _FILE_WRITER
         self._search_file_xml = SearchFileXMLUseCase()
 
         # Inicializa casos de uso
@@ -73,7 +96,61 @@ class DANFEGeneratorFacade:
             self._zpl_generator,
             self._search_file_xml
         )
-        self._save_use_case = SaveDANFEToFileUseCase(self._file_writer)
+        self._save_use_case = _SAVE_USE_CASE
+
+    @staticmethod
+    def generate_batch(
+        xml_file_paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None,
+        output_dir: Optional[Union[str, Path]] = None
+    ) -> List[DANFE]:
+        """
+        Gera (e opcionalmente salva) o DANFE de vários XMLs em paralelo.
+        
+        Os XMLs são distribuídos entre processos, em cerca de 4 lotes por
+        processo; cada processo usa os próprios parser e gerador e, com
+        ``output_dir``, também grava o ZPL, de modo que leitura, geração e
+        escrita se sobrepõem. Lotes pequenos (menos de 8 arquivos, ou um
+        único processo) são processados sequencialmente.
+        
+        Parameters
+        ----------
+        xml_file_paths : Iterable[Union[str, Path]]
+            Caminhos dos arquivos XML da NFe
+        workers : Optional[int], optional
+            Número de processos (default: os.cpu_count())
+        output_dir : Optional[Union[str, Path]], optional
+            Diretório onde salvar cada ZPL como ``<nome do XML>.zpl``;
+            se None, os DANFEs não são salvos (default: None)
+        
+        Returns
+        -------
+        List[DANFE]
+            DANFEs gerados, na ordem recebida
+        
+        Raises
+        ------
+        ValueError
+            Se algum XML não for válido ou os dados estiverem incorretos
+        FileNotFoundError
+            Se algum arquivo XML não for encontrado
+        IOError
+            Se houver erro ao escrever algum arquivo
+        
+        Examples
+        --------
+        >>> danfes = DANFEGeneratorFacade.generate_batch(["nfe1.xml", "nfe2.xml"], output_dir="saida")
+        >>> print(danfes[0].get_info_summary())
+        NFe 123/1 - Emitente: Empresa LTDA - Destinatário: João Silva
+        """
+        xml_file_paths = list(xml_file_paths)
+        workers = min(workers or os.cpu_count() or 1, len(xml_file_paths))
+        if len(xml_file_paths) < _GENERATE_BATCH_MIN_PARALELO or workers < 2:
+            return [_generate_one(path, output_dir) for path in xml_file_paths]
+
+        chunksize = max(1, len(xml_file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_generate_one, xml_file_paths, repeat(output_dir), chunksize=chunksize))
 
     def generate_danfe(self) -> DANFE:
         """
@@ -184,20 +261,26 @@ class DANFEGeneratorFacade:
 
         nfe_data = self._danfe.nfe_data
 
-        print("=== INFORMAÇÕES DA NFe ===")
-        print(f"Número: {nfe_data.numero}")
-        print(f"Série: {nfe_data.serie}")
-        print(f"Data Emissão: {nfe_data.get_data_emissao_formatada()}")
-        print(f"Chave de Acesso: {nfe_data.chave_acesso}")
+        lines = [
+            "=== INFORMAÇÕES DA NFe ===",
+            f"Número: {nfe_data.numero}",
+            f"Série: {nfe_data.serie}",
+            f"Data Emissão: {nfe_data.get_data_emissao_formatada()}",
+            f"Chave de Acesso: {nfe_data.chave_acesso}",
+        ]
 
         if nfe_data.protocolo:
-            print(f"Protocolo: {nfe_data.protocolo.numero}")
-            print(f"Data Autorização: {nfe_data.protocolo.get_data_formatada()}")
+            lines.append(f"Protocolo: {nfe_data.protocolo.numero}")
+            lines.append(f"Data Autorização: {nfe_data.protocolo.get_data_formatada()}")
 
-        print(f"Emitente: {nfe_data.emitente.nome}")
-        print(f"CNPJ: {nfe_data.emitente.get_cnpj_formatado()}")
-        print(f"Destinatário: {nfe_data.destinatario.nome}")
-        print(f"{nfe_data.destinatario.tipo_documento.value}: {nfe_data.destinatario.get_documento_formatado()}")
+        lines.append(f"Emitente: {nfe_data.emitente.nome}")
+        lines.append(f"CNPJ: {nfe_data.emitente.get_cnpj_formatado()}")
+        lines.append(f"Destinatário: {nfe_data.destinatario.nome}")
+        lines.append(f"{nfe_data.destinatario.tipo_documento.value}: {nfe_data.destinatario.get_documento_formatado()}")
+
+        # Bloco inteiro em uma única escrita no stdout
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
     @property
     def danfe(self) -> DANFE:
@@ -217,3 +300,26 @@ class DANFEGeneratorFacade:
         NFe 123/1 - Emitente: Empresa LTDA - Destinatário: João Silva
         """
         return self._danfe
+
+
+def _generate_one(xml_file_path: Union[str, Path], output_dir: Optional[Union[str, Path]] = None) -> DANFE:
+    """
+    Gera o DANFE de um único XML (executado nos processos de generate_batch).
+    
+    Parameters
+    ----------
+    xml_file_path : Union[str, Path]
+        Caminho para o arquivo XML da NFe
+    output_dir : Optional[Union[str, Path]], optional
+        Diretório onde salvar o ZPL como ``<nome do XML>.zpl`` (default: None)
+    
+    Returns
+    -------
+    DANFE
+        DANFE gerado com código ZPL
+    """
+    generator = DANFEGeneratorFacade(xml_file_path)
+    danfe = generator.generate_danfe()
+    if output_dir is not None:
+        generator.save_danfe(Path(output_dir) / f"{Path(xml_file_path).stem}.zpl")
+    return danfe
@@ -7,5 +7,6 @@ banco de dados, etc.
 """
 
 from .file_system_writer import FileSystemWriter
+from .pipelined_file_writer import PipelinedFileWriter
 
-__all__ = ['FileSystemWriter']
+__all__ = ['FileSystemWriter', 'PipelinedFileWriter']
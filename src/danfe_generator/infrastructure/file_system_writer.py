@@ -5,12 +5,35 @@ Este módulo implementa a interface FileWriterInterface para
 escrever arquivos diretamente no sistema de arquivos local.
 """
 
-from typing import Union
+import errno
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Set, Tuple, Union
 from pathlib import Path
 
 from ..domain.interfaces.file_writer import FileWriterInterface
 
 
+# O_BINARY só existe no Windows, onde evita a conversão de quebras de linha
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# O_DIRECT (Linux) exige buffer e tamanho alinhados; só compensa em ZPLs grandes
+_O_DIRECT = getattr(os, 'O_DIRECT', 0)
+_DIRECT_IO_MIN_SIZE = 64 * 1024
+_DIRECT_IO_ALIGNMENT = mmap.PAGESIZE
+
+# os.writev não existe no Windows; o kernel limita os buffers por chamada
+_WRITEV = getattr(os, 'writev', None)
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
 class FileSystemWriter(FileWriterInterface):
     """
     Implementação de FileWriterInterface para sistema de arquivos.
@@ -26,14 +49,46 @@ class FileSystemWriter(FileWriterInterface):
     True
     """
 
-    def write(self, content: str, file_path: Union[str, Path]) -> None:
+    def __init__(self, direct_io: bool = False):
+        """
+        Inicializa o escritor com o registro de diretórios já criados.
+        
+        Parameters
+        ----------
+        direct_io : bool, optional
+            Se True, grava com os.open/os.write, sem os objetos de arquivo
+            do Python; conteúdos a partir de 64 KiB usam O_DIRECT quando o
+            sistema de arquivos suporta (default: False)
+        """
+        self._direct_io = direct_io
+        self._ensured_dirs: Set[Path] = set()
+        # Buffers alinhados por thread, reaproveitados entre escritas O_DIRECT;
+        # a lista guarda todos eles para que close() possa liberá-los
+        self._aligned_buffers = threading.local()
+        self._all_aligned_buffers: List[mmap.mmap] = []
+        self._buffers_lock = threading.Lock()
+
+    def close(self) -> None:
+        """
+        Libera os buffers alinhados usados pelas escritas O_DIRECT.
+        
+        O escritor continua utilizável; novos buffers são criados sob demanda.
+        """
+        with self._buffers_lock:
+            buffers, self._all_aligned_buffers = self._all_aligned_buffers, []
+            self._aligned_buffers = threading.local()
+        for buffer in buffers:
+            buffer.close()
+
+    def write(self, content: Union[str, bytes], file_path: Union[str, Path]) -> None:
         """
         Escreve conteúdo em um arquivo no sistema de arquivos.
         
         Parameters
         ----------
-        content : str
-            Conteúdo a ser escrito
+        content : Union[str, bytes]
+            Conteúdo a ser escrito; ``str`` é codificado em UTF-8 e
+            ``bytes`` é gravado sem conversão
         file_path : Union[str, Path]
             Caminho do arquivo de destino
         
@@ -50,20 +105,287 @@ class FileSystemWriter(FileWriterInterface):
         >>> writer.write("Hello World", "hello.txt")
         """
         try:
-            path = Path(file_path)
+            path = self._prepare_path(file_path)
 
-            # Cria diretórios pai se não existirem
-            path.parent.mkdir(parents=True, exist_ok=True)
+            # Codifica uma única vez (ou usa os bytes recebidos) e grava em uma
+            # só chamada, sem TextIOWrapper
+            data = content.encode('utf-8') if isinstance(content, str) else content
+            try:
+                self._write_data(data, path)
+            except FileNotFoundError:
+                # O diretório pode ter sido removido depois de criado: recria e tenta uma vez
+                self._recreate_parent(path)
+                self._write_data(data, path)
 
-            # Escreve o arquivo
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        except PermissionError as e:
+            raise PermissionError(f"Sem permissão para escrever em '{file_path}': {e}") from e
+        except Exception as e:
+            raise IOError(f"Erro ao escrever arquivo '{file_path}': {e}") from e
+
+    def write_concat(
+        self,
+        contents: Iterable[Union[str, bytes]],
+        file_path: Union[str, Path]
+    ) -> None:
+        """
+        Escreve vários conteúdos em sequência em um único arquivo.
+        
+        Os conteúdos são gravados com os.writev (escrita vetorizada, sem
+        juntá-los em um novo buffer); no Windows, com ``writelines``.
+        
+        Parameters
+        ----------
+        contents : Iterable[Union[str, bytes]]
+            Conteúdos a serem escritos, na ordem desejada; ``str`` é
+            codificado em UTF-8
+        file_path : Union[str, Path]
+            Caminho do arquivo de destino
+        
+        Raises
+        ------
+        IOError
+            Se houver erro ao escrever o arquivo
+        PermissionError
+            Se não houver permissão para escrever no local
+        
+        Examples
+        --------
+        >>> writer = FileSystemWriter()
+        >>> writer.write_concat(["^XA...^XZ", "^XA...^XZ"], "spool.zpl")
+        """
+        try:
+            path = self._prepare_path(file_path)
+            buffers = [
+                content.encode('utf-8') if isinstance(content, str) else content
+                for content in contents
+            ]
+            try:
+                self._write_buffers(buffers, path)
+            except FileNotFoundError:
+                self._recreate_parent(path)
+                self._write_buffers(buffers, path)
 
         except PermissionError as e:
             raise PermissionError(f"Sem permissão para escrever em '{file_path}': {e}") from e
         except Exception as e:
             raise IOError(f"Erro ao escrever arquivo '{file_path}': {e}") from e
 
+    def _write_data(self, data: bytes, path: Path) -> None:
+        """
+        Grava os bytes no arquivo, com ou sem os objetos de arquivo do Python.
+        
+        Parameters
+        ----------
+        data : bytes
+            Conteúdo já codificado
+        path : Path
+            Caminho do arquivo de destino
+        """
+        if self._direct_io:
+            self._write_fd(data, path)
+        else:
+            with open(path, 'wb') as f:
+                f.write(data)
+
+    def _write_buffers(self, buffers: List[bytes], path: Path) -> None:
+        """
+        Grava os buffers em sequência no arquivo, com os.writev quando disponível.
+        
+        Parameters
+        ----------
+        buffers : List[bytes]
+            Conteúdos já codificados, na ordem de gravação
+        path : Path
+            Caminho do arquivo de destino
+        """
+        if _WRITEV is None:
+            with open(path, 'wb') as f:
+                f.writelines(buffers)
+            return
+
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            self._writev_all(fd, buffers)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _writev_all(fd: int, buffers: List[bytes]) -> None:
+        """
+        Grava todos os buffers com os.writev, retomando escritas parciais.
+        
+        Parameters
+        ----------
+        fd : int
+            Descritor do arquivo de destino
+        buffers : List[bytes]
+            Conteúdos já codificados, na ordem de gravação
+        """
+        views = [memoryview(buffer) for buffer in buffers if buffer]
+        start = 0
+        while start < len(views):
+            written = _WRITEV(fd, views[start:start + _IOV_MAX])
+            # Descarta os buffers gravados por completo e recorta o parcial
+            while written:
+                size = len(views[start])
+                if written < size:
+                    views[start] = views[start][written:]
+                    break
+                written -= size
+                start += 1
+
+    def write_many(self, items: Iterable[Tuple[Union[str, bytes], Union[str, Path]]]) -> None:
+        """
+        Escreve vários arquivos mantendo até 8 escritas em curso.
+        
+        Parameters
+        ----------
+        items : Iterable[Tuple[Union[str, bytes], Union[str, Path]]]
+            Pares (conteúdo, caminho do arquivo de destino)
+        
+        Raises
+        ------
+        IOError
+            Se houver erro ao escrever algum arquivo
+        PermissionError
+            Se não houver permissão para escrever no local
+        
+        Examples
+        --------
+        >>> writer = FileSystemWriter()
+        >>> writer.write_many([("^XA...^XZ", "a.zpl"), ("^XA...^XZ", "b.zpl")])
+        """
+        items = list(items)
+        if len(items) < 2:
+            super().write_many(items)
+            return
+
+        # As escritas esperam o disco ou a rede sem segurar o GIL
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+            for _ in executor.map(lambda item: self.write(*item), items):
+                pass
+
+    def _prepare_path(self, file_path: Union[str, Path]) -> Path:
+        """
+        Converte o caminho e cria os diretórios pai (uma vez por diretório).
+        
+        Parameters
+        ----------
+        file_path : Union[str, Path]
+            Caminho do arquivo de destino
+        
+        Returns
+        -------
+        Path
+            Caminho do arquivo de destino
+        """
+        path = file_path if isinstance(file_path, Path) else Path(file_path)
+        parent = path.parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
+        return path
+
+    def _recreate_parent(self, path: Path) -> None:
+        """
+        Recria o diretório pai de um arquivo, removido após ter sido criado.
+        
+        Parameters
+        ----------
+        path : Path
+            Caminho do arquivo de destino
+        """
+        parent = path.parent
+        self._ensured_dirs.discard(parent)
+        parent.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(parent)
+
+    def _write_fd(self, data: bytes, path: Path) -> None:
+        """
+        Grava os bytes diretamente no descritor de arquivo.
+        
+        Parameters
+        ----------
+        data : bytes
+            Conteúdo já codificado
+        path : Path
+            Caminho do arquivo de destino
+        """
+        if _O_DIRECT and len(data) >= _DIRECT_IO_MIN_SIZE:
+            try:
+                self._write_o_direct(data, path)
+                return
+            except OSError as e:
+                # Sistema de arquivos sem suporte a O_DIRECT (tmpfs, SMB...): escrita comum
+                if e.errno != errno.EINVAL:
+                    raise
+
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                # os.write pode gravar apenas parte do buffer
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    def _write_o_direct(self, data: bytes, path: Path) -> None:
+        """
+        Grava os bytes com O_DIRECT, sem passar pelo cache de páginas.
+        
+        O conteúdo é copiado para um buffer alinhado à página, completado
+        com zeros até o limite do bloco e gravado em um arquivo temporário
+        no mesmo diretório; depois de truncado para o tamanho real, o
+        temporário substitui o destino com os.replace, de modo que leitores
+        (e a impressora) nunca vejam o preenchimento com zeros.
+        
+        Parameters
+        ----------
+        data : bytes
+            Conteúdo já codificado
+        path : Path
+            Caminho do arquivo de destino
+        
+        Raises
+        ------
+        OSError
+            Com errno EINVAL se o sistema de arquivos não suportar O_DIRECT
+        """
+        size = len(data)
+        aligned_size = -(-size // _DIRECT_IO_ALIGNMENT) * _DIRECT_IO_ALIGNMENT
+
+        # mmap anônimo é sempre alinhado à página
+        buffer = getattr(self._aligned_buffers, 'buffer', None)
+        if buffer is None or len(buffer) < aligned_size:
+            new_buffer = mmap.mmap(-1, aligned_size)
+            with self._buffers_lock:
+                if buffer is not None:
+                    self._all_aligned_buffers.remove(buffer)
+                    buffer.close()
+                self._all_aligned_buffers.append(new_buffer)
+            buffer = self._aligned_buffers.buffer = new_buffer
+        buffer[:size] = data
+        buffer[size:aligned_size] = bytes(aligned_size - size)
+
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            fd = os.open(tmp_path, _WRITE_FLAGS | _O_DIRECT, 0o644)
+            try:
+                with memoryview(buffer) as view:
+                    written = 0
+                    while written < aligned_size:
+                        written += os.write(fd, view[written:aligned_size])
+                os.ftruncate(fd, size)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def exists(self, file_path: Union[str, Path]) -> bool:
         """
         Verifica se um arquivo existe no sistema de arquivos.
@@ -86,7 +408,5 @@ class FileSystemWriter(FileWriterInterface):
         >>> writer.exists("arquivo_inexistente.txt")
         False
         """
-        try:
-            return Path(file_path).exists()
-        except Exception:
-            return False
+        # os.path.exists já retorna False para erros de acesso e caminhos inválidos
+        return os.path.exists(file_path)
@@ -4,22 +4,58 @@ Classe para buscar arquivos XML no sistema de arquivos.
 
 from dataclasses import dataclass, field
 import os
-from datetime import datetime
-from typing import Optional, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from pathlib import Path
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Iterator, Optional
 
 from ..domain.interfaces.file_search_xml import FileSearchXMLInterface
 
 
+_XML_BASE_DIR = '//10.4.1.2/DRIVE-D/0_ecommerce_XML'
+
+
+@lru_cache(maxsize=1)
+def _month_dir_path(year: int, month: int) -> str:
+    """
+    Monta o caminho do diretório de XMLs do mês (AAAA-MM).
+    
+    Parameters
+    ----------
+    year : int
+        Ano do diretório
+    month : int
+        Mês do diretório
+    
+    Returns
+    -------
+    str
+        Caminho do diretório de XMLs do mês
+    """
+    return f'{_XML_BASE_DIR}/{year:04d}-{month:02d}'
+
+
+def _current_month_dir_path() -> str:
+    """
+    Retorna o diretório de XMLs do mês corrente.
+    
+    O caminho fica em cache enquanto o mês não muda; na virada do mês
+    a chave (ano, mês) muda e o caminho é recalculado.
+    
+    Returns
+    -------
+    str
+        Caminho do diretório de XMLs do mês corrente
+    """
+    today = date.today()
+    return _month_dir_path(today.year, today.month)
+
+
 @dataclass
 class FileSystemSearchXMLConfig:
     """
     Configuração para buscar arquivos XML no sistema de arquivos.
     """
-    xml_dir_path: str = field(
-        default_factory=lambda: f'//10.4.1.2/DRIVE-D/0_ecommerce_XML/{datetime.today().strftime("%Y-%m")}'
-        )
+    xml_dir_path: str = field(default_factory=_current_month_dir_path)
 
 
 class FileSystemSearchXML(FileSearchXMLInterface):
@@ -73,50 +109,46 @@ class FileSystemSearchXML(FileSearchXMLInterface):
         """
         self._mtime_cache.clear()
 
-    def _process_file_batch(self, files_batch: list[str], cod_invoice: Optional[str] = None) -> list[str]:
+    def iter_files_xml(self, cod_invoice: Optional[str] = None) -> Iterator[str]:
         """
-        Processa um lote de arquivos de forma concorrente.
+        Percorre os arquivos XML do diretório sob demanda.
+        
+        A enumeração avança apenas enquanto quem consome pede o próximo
+        item, de modo que quem precisa só do primeiro resultado não lê o
+        restante do diretório nem monta uma lista.
         
         Parameters
         ----------
-        files_batch : list[str]
-            Lista de nomes de arquivos para processar
         cod_invoice : Optional[str], optional
-            Código da nota fiscal para filtrar
+            Código da nota fiscal para filtrar arquivos específicos
             
-        Returns
-        -------
-        list[str]
-            Lista de caminhos completos de arquivos XML válidos
+        Yields
+        ------
+        str
+            Caminho completo de cada arquivo XML encontrado
+            
+        Raises
+        ------
+        OSError
+            Se o diretório não puder ser acessado
+            
+        Examples
+        --------
+        >>> fs = FileSystemSearchXML(config)
+        >>> primeiro = next(fs.iter_files_xml("12345"), None)
         """
-        valid_files = []
-        base_path = Path(self.config.xml_dir_path)
-
-        for filename in files_batch:
-            # Filtro rápido: extensão .xml primeiro
-            if not filename.endswith('.xml'):
-                continue
-
-            # Filtro de código se especificado
-            if cod_invoice and cod_invoice not in filename:
-                continue
-
-            full_path = str(base_path / filename)
-            # Converte caminho Windows UNC para formato Unix para compatibilidade
-            full_path = full_path.replace('\\', '/')
-            try:
-                # Verifica se arquivo existe e tem data de modificação válida
-                if self.get_file_m_datetime(full_path):
-                    valid_files.append(full_path)
-            except (OSError, FileNotFoundError):
-                # Ignora arquivos que não podem ser acessados
-                continue
-
-        return valid_files
+        # Nomes usados a cada iteração ligados a variáveis locais
+        endswith = str.endswith
+        with os.scandir(self.config.xml_dir_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if (not cod_invoice or cod_invoice in name) and endswith(name, '.xml'):
+                    # Converte caminho Windows UNC para formato Unix para compatibilidade
+                    yield entry.path.replace('\\', '/')
 
     def listing_files_xml(self, cod_invoice: Optional[str] = None) -> Optional[str] | list[str]:
         """
-        Lista os arquivos XML no diretório de forma otimizada e concorrente.
+        Lista os arquivos XML no diretório de forma otimizada.
         
         Parameters
         ----------
@@ -143,46 +175,8 @@ class FileSystemSearchXML(FileSearchXMLInterface):
         >>> todos_xmls = fs.listing_files_xml()
         """
         try:
-            all_files = os.listdir(self.config.xml_dir_path)
+            if cod_invoice:
+                return next(self.iter_files_xml(cod_invoice), None)
+            return list(self.iter_files_xml())
         except OSError as e:
             raise OSError(f"Não foi possível acessar o diretório: {self.config.xml_dir_path}") from e
-
-        # Pre-filtro rápido para arquivos .xml
-        xml_files = [f for f in all_files if f.endswith('.xml')]
-
-        if not xml_files:
-            return None if cod_invoice else []
-
-        # Para poucos arquivos, processamento sequencial é mais eficiente
-        if len(xml_files) <= 10:
-            valid_files = self._process_file_batch(xml_files, cod_invoice)
-        else:
-            # Processamento concorrente para muitos arquivos
-            batch_size = max(1, len(xml_files) // 4)  # 4 threads
-            batches = [xml_files[i:i + batch_size] for i in range(0, len(xml_files), batch_size)]
-
-            valid_files = []
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                # Submete tarefas concorrentemente
-                future_to_batch = {
-                    executor.submit(self._process_file_batch, batch, cod_invoice): batch
-                    for batch in batches
-                }
-
-                # Coleta resultados
-                for future in as_completed(future_to_batch):
-                    try:
-                        batch_results = future.result()
-                        valid_files.extend(batch_results)
-
-                        # Se buscando arquivo específico e encontrou, retorna imediatamente
-                        if cod_invoice and batch_results:
-                            return batch_results[0]
-                    except (OSError, FileNotFoundError):
-                        # Ignora erros de arquivo e continua processamento
-                        continue
-
-        # Retorna resultado baseado no tipo de busca
-        if cod_invoice:
-            return valid_files[0] if valid_files else None
-        return valid_files
@@ -0,0 +1,173 @@
+"""
+Escritor de arquivos com escrita assíncrona em segundo plano.
+
+Este módulo implementa a interface FileWriterInterface delegando as
+escritas a outro escritor em uma thread dedicada, de modo que quem
+chama possa preparar o próximo DANFE enquanto o anterior é gravado.
+"""
+
+import atexit
+import queue
+import threading
+from typing import List, Optional, Union
+from pathlib import Path
+
+from ..domain.interfaces.file_writer import FileWriterInterface
+
+
+class PipelinedFileWriter(FileWriterInterface):
+    """
+    Escritor que enfileira as escritas e as executa em segundo plano.
+    
+    ``write`` retorna assim que o conteúdo entra na fila; erros de
+    escrita são relançados em ``flush`` (ou ao sair do bloco ``with``).
+    Escritores não fechados são fechados ao encerrar o interpretador,
+    gravando o que ainda estiver na fila.
+    
+    Parameters
+    ----------
+    file_writer : FileWriterInterface
+        Escritor que efetivamente grava os arquivos
+    max_pending : int, optional
+        Número máximo de escritas na fila antes de ``write`` bloquear
+        (default: 64)
+    
+    Examples
+    --------
+    >>> with PipelinedFileWriter(FileSystemWriter()) as writer:
+    ...     writer.write("^XA...^XZ", "a.zpl")
+    ...     writer.write("^XA...^XZ", "b.zpl")
+    """
+
+    def __init__(self, file_writer: FileWriterInterface, max_pending: int = 64):
+        """
+        Inicializa o escritor e a thread de escrita.
+        
+        Parameters
+        ----------
+        file_writer : FileWriterInterface
+            Escritor que efetivamente grava os arquivos
+        max_pending : int, optional
+            Número máximo de escritas na fila (default: 64)
+        """
+        self._file_writer = file_writer
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._errors: List[Exception] = []
+        self._closed = False
+        # Protege _closed, _errors e a contagem de escritas em andamento; o lock
+        # nunca é mantido durante o put, que bloqueia com a fila cheia
+        self._lock = threading.Lock()
+        self._producers_done = threading.Condition(self._lock)
+        self._producers = 0
+        # A thread é daemon para não travar o encerramento; o atexit garante
+        # que a fila seja gravada antes de o interpretador terminar
+        self._worker = threading.Thread(target=self._drain, name="PipelinedFileWriter", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def _drain(self) -> None:
+        """Consome a fila, gravando cada item na ordem em que foi enfileirado."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._file_writer.write(*item)
+            except Exception as e:
+                with self._lock:
+                    self._errors.append(e)
+            finally:
+                self._queue.task_done()
+
+    def write(self, content: Union[str, bytes], file_path: Union[str, Path]) -> None:
+        """
+        Enfileira a escrita do conteúdo e retorna imediatamente.
+        
+        Parameters
+        ----------
+        content : Union[str, bytes]
+            Conteúdo a ser escrito; ``str`` é codificado em UTF-8 e
+            ``bytes`` é gravado sem conversão
+        file_path : Union[str, Path]
+            Caminho do arquivo de destino
+        
+        Raises
+        ------
+        RuntimeError
+            Se o escritor já tiver sido fechado
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PipelinedFileWriter já foi fechado")
+            self._producers += 1
+        try:
+            self._queue.put((content, file_path))
+        finally:
+            with self._lock:
+                self._producers -= 1
+                if not self._producers:
+                    self._producers_done.notify_all()
+
+    def flush(self) -> None:
+        """
+        Aguarda a conclusão de todas as escritas enfileiradas.
+        
+        Raises
+        ------
+        IOError
+            Se alguma escrita pendente tiver falhado (relança o primeiro erro)
+        PermissionError
+            Se não houver permissão para escrever no local
+        """
+        self._queue.join()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        """
+        Conclui as escritas pendentes e encerra a thread de escrita.
+        
+        Raises
+        ------
+        IOError
+            Se alguma escrita pendente tiver falhado
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            # Escritas que já passaram pela verificação entram na fila antes
+            # do sinal de término
+            self._producers_done.wait_for(lambda: not self._producers)
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        self._worker.join()
+        self.flush()
+
+    def exists(self, file_path: Union[str, Path]) -> bool:
+        """
+        Verifica se um arquivo existe, após concluir as escritas pendentes.
+        
+        Parameters
+        ----------
+        file_path : Union[str, Path]
+            Caminho do arquivo a verificar
+        
+        Returns
+        -------
+        bool
+            True se o arquivo existir, False caso contrário
+        """
+        self.flush()
+        return self._file_writer.exists(file_path)
+
+    def __enter__(self) -> 'PipelinedFileWriter':
+        """Permite o uso em blocos ``with``."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        """Conclui as escritas pendentes ao sair do bloco ``with``."""
+        self.close()
+        return None
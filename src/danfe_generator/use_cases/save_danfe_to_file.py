@@ -5,7 +5,7 @@ Este módulo implementa o caso de uso para persistir
 o código ZPL do DANFE em um arquivo.
 """
 
-from typing import Union
+from typing import Iterable, List, Union
 from pathlib import Path
 
 from ..domain.entities.danfe import DANFE
@@ -32,7 +32,7 @@ class SaveDANFEToFileUseCase:
     DANFE salvo em: output.zpl
     """
 
-    def __init__(self, file_writer: FileWriterInterface):
+    def __init__(self, file_writer: FileWriterInterface, await_completion: bool = False):
         """
         Inicializa o caso de uso com as dependências necessárias.
         
@@ -40,8 +40,16 @@ class SaveDANFEToFileUseCase:
         ----------
         file_writer : FileWriterInterface
             Escritor para salvar arquivos
+        await_completion : bool, optional
+            Se True, ``execute`` também aguarda a gravação quando o escritor
+            é assíncrono (possui ``flush``); por padrão retorna assim que a
+            escrita é enfileirada e os erros aparecem no ``flush``/``close``
+            do escritor. ``execute_many`` e ``execute_concat`` sempre
+            aguardam o lote (default: False)
         """
         self._file_writer = file_writer
+        self._write = file_writer.write
+        self._await_completion = await_completion
 
     def execute(
         self,
@@ -83,6 +91,114 @@ class SaveDANFEToFileUseCase:
         file_path_str = str(output_file_path)
 
         # Escreve o código ZPL no arquivo
-        self._file_writer.write(danfe.codigo_zpl, file_path_str)
+        self._write(danfe.codigo_zpl, file_path_str)
+        if self._await_completion:
+            self._wait_for_writer()
 
         return file_path_str
+
+    def execute_many(
+        self,
+        danfes: Iterable[DANFE],
+        output_file_paths: Iterable[Union[str, Path]]
+    ) -> List[str]:
+        """
+        Salva vários DANFEs, entregando todas as escritas ao escritor de uma vez.
+        
+        Parameters
+        ----------
+        danfes : Iterable[DANFE]
+            DANFEs a serem salvos
+        output_file_paths : Iterable[Union[str, Path]]
+            Caminhos dos arquivos de saída, na mesma ordem dos DANFEs
+        
+        Returns
+        -------
+        List[str]
+            Caminhos dos arquivos salvos
+        
+        Raises
+        ------
+        IOError
+            Se houver erro ao escrever algum arquivo
+        ValueError
+            Se algum DANFE não for válido ou as quantidades não coincidirem
+        
+        Examples
+        --------
+        >>> paths = use_case.execute_many([danfe1, danfe2], ["a.zpl", "b.zpl"])
+        >>> print(paths)
+        ['a.zpl', 'b.zpl']
+        """
+        danfes = list(danfes)
+        file_paths = [str(output_file_path) for output_file_path in output_file_paths]
+        if len(danfes) != len(file_paths):
+            raise ValueError("Deve haver um caminho de saída para cada DANFE")
+
+        for danfe in danfes:
+            if not isinstance(danfe, DANFE):
+                raise ValueError("O objeto fornecido deve ser uma instância de DANFE")
+
+        # Escreve todos os códigos ZPL em um único lote
+        self._file_writer.write_many(
+            [
+                (danfe.codigo_zpl, file_path)
+                for danfe, file_path in zip(danfes, file_paths)
+            ]
+        )
+        self._wait_for_writer()
+
+        return file_paths
+
+    def execute_concat(
+        self,
+        danfes: Iterable[DANFE],
+        output_file_path: Union[str, Path] = "danfe_generated.zpl"
+    ) -> str:
+        """
+        Salva vários DANFEs em sequência em um único arquivo de spool.
+        
+        Parameters
+        ----------
+        danfes : Iterable[DANFE]
+            DANFEs a serem salvos, na ordem de impressão
+        output_file_path : Union[str, Path], optional
+            Caminho do arquivo de saída (default: "danfe_generated.zpl")
+        
+        Returns
+        -------
+        str
+            Caminho do arquivo salvo
+        
+        Raises
+        ------
+        IOError
+            Se houver erro ao escrever o arquivo
+        ValueError
+            Se algum DANFE não for válido
+        
+        Examples
+        --------
+        >>> file_path = use_case.execute_concat([danfe1, danfe2], "spool.zpl")
+        >>> print(file_path)
+        spool.zpl
+        """
+        payloads = []
+        for danfe in danfes:
+            if not isinstance(danfe, DANFE):
+                raise ValueError("O objeto fornecido deve ser uma instância de DANFE")
+            payloads.append(danfe.codigo_zpl)
+
+        file_path_str = str(output_file_path)
+
+        # Escreve todos os códigos ZPL no mesmo arquivo, em uma única gravação
+        self._file_writer.write_concat(payloads, file_path_str)
+        self._wait_for_writer()
+
+        return file_path_str
+
+    def _wait_for_writer(self) -> None:
+        """Aguarda as escritas pendentes de escritores assíncronos (com ``flush``)."""
+        flush = getattr(self._file_writer, 'flush', None)
+        if flush is not None:
+            flush()
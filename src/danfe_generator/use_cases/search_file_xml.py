@@ -1,27 +1,69 @@
 """
 Caso de uso para buscar arquivos XML no sistema de arquivos.
 """
-from typing import Optional
+import os
+import threading
+from typing import Dict, Optional, Tuple
+from ..domain.interfaces.file_search_xml import FileSearchXMLInterface
 from ..infrastructure.file_sytem_search_xml import FileSystemSearchXML, FileSystemSearchXMLConfig
 
 
+# Última listagem completa de cada diretório, compartilhada entre instâncias
+# (a facade cria um caso de uso por NFe): diretório -> (mtime, ((nome, caminho), ...))
+_INDEXES: Dict[str, Tuple[int, Tuple[Tuple[str, str], ...]]] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
 class SearchFileXMLUseCase():
     """
     Caso de uso para buscar arquivos XML no sistema de arquivos.
 
     Parameters
     ----------
-    file_search_xml : FileSearchXMLInterface
-        Interface para buscar arquivos XML no sistema de arquivos.
+    file_search_xml : FileSearchXMLInterface, optional
+        Interface para buscar arquivos XML no sistema de arquivos
+        (default: FileSystemSearchXML com a configuração padrão).
     """
-    def __init__(self):
+    def __init__(self, file_search_xml: Optional[FileSearchXMLInterface] = None):
         """
         Inicializa o caso de uso com as dependências necessárias.
         """
-        self.file_search_xml = FileSystemSearchXML(FileSystemSearchXMLConfig())
+        self.file_search_xml = file_search_xml or FileSystemSearchXML(FileSystemSearchXMLConfig())
 
     def execute(self, cod_invoice: Optional[str] = None) -> Optional[str] | list[str]:
         """
         Executa o caso de uso para buscar arquivos XML no sistema de arquivos.
+
+        A listagem completa do diretório fica guardada enquanto o diretório
+        não for modificado, e as buscas por nota a consultam primeiro. Sem
+        listagem válida, ou se a nota não estiver nela, a busca é delegada
+        ao buscador, que para no primeiro arquivo encontrado.
         """
+        config = getattr(self.file_search_xml, 'config', None)
+        xml_dir_path = getattr(config, 'xml_dir_path', None)
+        if xml_dir_path is None:
+            # Buscador sem diretório configurado: delega a busca por completo
+            return self.file_search_xml.listing_files_xml(cod_invoice=cod_invoice)
+
+        try:
+            mtime_ns = os.stat(xml_dir_path).st_mtime_ns
+        except OSError as e:
+            raise OSError(f"Não foi possível acessar o diretório: {xml_dir_path}") from e
+
+        if not cod_invoice:
+            paths = self.file_search_xml.listing_files_xml()
+            index = tuple((path.rsplit('/', 1)[-1], path) for path in paths)
+            with _INDEXES_LOCK:
+                _INDEXES[xml_dir_path] = (mtime_ns, index)
+            return list(paths)
+
+        with _INDEXES_LOCK:
+            cached = _INDEXES.get(xml_dir_path)
+        if cached is not None and cached[0] == mtime_ns:
+            for name, path in cached[1]:
+                if cod_invoice in name:
+                    return path
+
+        # Sem listagem válida, ou nota ausente dela (em compartilhamentos SMB
+        # um XML novo pode chegar sem alterar o mtime): busca com parada antecipada
         return self.file_search_xml.listing_files_xml(cod_invoice=cod_invoice)
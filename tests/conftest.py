@@ -0,0 +1,50 @@
+"""
+Fixtures compartilhadas pelos testes do danfe_generator.
+"""
+
+from pathlib import Path
+
+import pytest
+
+
+NFE_XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<nfeProc xmlns="http://www.portalfiscal.inf.br/nfe" versao="4.00">
+  <NFe xmlns="http://www.portalfiscal.inf.br/nfe">
+    <infNFe Id="NFe352509123456780001955500100000{numero}1000012345" versao="4.00">
+      <ide>
+        <nNF>{numero}</nNF>
+        <serie>1</serie>
+        <dhEmi>2025-09-01T08:55:05-03:00</dhEmi>
+      </ide>
+      <emit>
+        <CNPJ>12345678000195</CNPJ>
+        <xNome>Empresa Exemplo LTDA</xNome>
+        <enderEmit><UF>SP</UF></enderEmit>
+        <IE>123456789</IE>
+      </emit>
+      <dest>
+        <CPF>12345678901</CPF>
+        <xNome>Joao da Silva</xNome>
+        <enderDest><UF>RJ</UF></enderDest>
+      </dest>
+    </infNFe>
+  </NFe>
+  <protNFe versao="4.00">
+    <infProt>
+      <nProt>135250000000001</nProt>
+      <dhRecbto>2025-09-01T08:55:07-03:00</dhRecbto>
+    </infProt>
+  </protNFe>
+</nfeProc>
+"""
+
+
+@pytest.fixture
+def make_nfe_xml(tmp_path):
+    """Cria um XML de NFe válido; ``numero`` deve ter 4 dígitos."""
+    def _make(numero: str = "1234", directory: Path = tmp_path) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"nf_{numero}.xml"
+        path.write_text(NFE_XML_TEMPLATE.format(numero=numero), encoding="utf-8")
+        return path
+    return _make
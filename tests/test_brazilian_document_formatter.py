@@ -0,0 +1,50 @@
+"""
+Testes do BrazilianDocumentFormatter.
+"""
+
+import pytest
+
+from danfe_generator.adapters.formatters import brazilian_document_formatter
+from danfe_generator.adapters.formatters.brazilian_document_formatter import BrazilianDocumentFormatter
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    brazilian_document_formatter._format_cpf.cache_clear()
+    brazilian_document_formatter._format_cnpj.cache_clear()
+
+
+def test_format_document_masks_cpf_and_cnpj():
+    formatter = BrazilianDocumentFormatter()
+
+    assert formatter.format_document("12345678901") == "123.456.789-01"
+    assert formatter.format_document("12345678000195") == "12.345.678/0001-95"
+    assert formatter.format_document("") == ""
+
+
+def test_repeated_documents_are_served_from_cache():
+    # Instâncias diferentes compartilham o mesmo cache
+    assert BrazilianDocumentFormatter().format_cnpj("12345678000195") == "12.345.678/0001-95"
+    assert BrazilianDocumentFormatter().format_cnpj("12345678000195") == "12.345.678/0001-95"
+    BrazilianDocumentFormatter().format_cpf("12345678901")
+
+    assert brazilian_document_formatter._format_cnpj.cache_info().hits == 1
+    assert brazilian_document_formatter._format_cpf.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("method, value", [
+    ("format_cpf", "1234567890"),
+    ("format_cpf", "1234567890a"),
+    ("format_cnpj", "1234567800019"),
+    ("format_cnpj", "1234567800019a"),
+    ("format_document", "123"),
+])
+def test_invalid_documents_raise_every_time_and_are_not_cached(method, value):
+    formatter = BrazilianDocumentFormatter()
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            getattr(formatter, method)(value)
+
+    assert brazilian_document_formatter._format_cpf.cache_info().currsize == 0
+    assert brazilian_document_formatter._format_cnpj.cache_info().currsize == 0
@@ -0,0 +1,49 @@
+"""
+Testes do DANFEGeneratorFacade.
+"""
+
+from danfe_generator import DANFEGenerator
+
+
+def test_facades_do_not_share_parsed_data_or_generator_config(make_nfe_xml):
+    path = make_nfe_xml()
+    first = DANFEGenerator(path)
+    first._zpl_generator.config.cpf_dest = True
+    first.generate_danfe().nfe_data.emitente.nome = "Alterado"
+
+    second = DANFEGenerator(path)
+    danfe = second.generate_danfe()
+
+    assert danfe.nfe_data.emitente.nome == "Empresa Exemplo LTDA"
+    assert second._zpl_generator.config.cpf_dest is False
+    assert "CPF: -" in danfe.codigo_zpl
+
+
+def test_generate_batch_sequential_saves_to_output_dir(make_nfe_xml, tmp_path):
+    sources = [make_nfe_xml(f"{i:04d}") for i in range(3)]
+
+    danfes = DANFEGenerator.generate_batch(sources, output_dir=tmp_path / "saida")
+
+    assert [d.nfe_data.numero for d in danfes] == ["0000", "0001", "0002"]
+    for source, danfe in zip(sources, danfes):
+        saved = (tmp_path / "saida" / f"{source.stem}.zpl").read_text(encoding="utf-8")
+        assert saved == danfe.codigo_zpl
+
+
+def test_generate_batch_uses_worker_processes(make_nfe_xml, tmp_path):
+    sources = [make_nfe_xml(f"{i:04d}") for i in range(10)]
+
+    danfes = DANFEGenerator.generate_batch(sources, workers=2, output_dir=tmp_path / "saida")
+
+    assert [d.nfe_data.numero for d in danfes] == [f"{i:04d}" for i in range(10)]
+    assert len(list((tmp_path / "saida").glob("*.zpl"))) == 10
+
+
+def test_generate_batch_without_output_dir_writes_nothing(make_nfe_xml, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = make_nfe_xml(directory=tmp_path / "xml")
+
+    (danfe,) = DANFEGenerator.generate_batch([source])
+
+    assert danfe.nfe_data.numero == "1234"
+    assert not list(tmp_path.rglob("*.zpl"))
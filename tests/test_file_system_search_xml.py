@@ -0,0 +1,72 @@
+"""
+Testes do FileSystemSearchXML e da configuração do diretório mensal.
+"""
+
+from datetime import date
+
+import pytest
+
+from danfe_generator.infrastructure import file_sytem_search_xml
+from danfe_generator.infrastructure.file_sytem_search_xml import (
+    FileSystemSearchXML,
+    FileSystemSearchXMLConfig,
+)
+
+
+class _FixedDate(date):
+    """Data fixa para simular a virada do mês."""
+
+    today_value = date(2025, 9, 30)
+
+    @classmethod
+    def today(cls):
+        return cls.today_value
+
+
+def test_config_default_follows_the_current_month(monkeypatch):
+    monkeypatch.setattr(file_sytem_search_xml, "date", _FixedDate)
+    file_sytem_search_xml._month_dir_path.cache_clear()
+
+    setembro = FileSystemSearchXMLConfig().xml_dir_path
+    assert FileSystemSearchXMLConfig().xml_dir_path is setembro
+    _FixedDate.today_value = date(2025, 10, 1)
+    outubro = FileSystemSearchXMLConfig().xml_dir_path
+
+    assert setembro == f"{file_sytem_search_xml._XML_BASE_DIR}/2025-09"
+    assert outubro == f"{file_sytem_search_xml._XML_BASE_DIR}/2025-10"
+    assert file_sytem_search_xml._month_dir_path.cache_info().hits == 1
+
+
+def _searcher(xml_dir_path):
+    return FileSystemSearchXML(FileSystemSearchXMLConfig(xml_dir_path=str(xml_dir_path)))
+
+
+def test_iter_files_xml_filters_extension_and_invoice_code(tmp_path):
+    for name in ("nf_1234.xml", "nf_5678.xml", "nf_1234.txt", "nf_1234.xml.bak"):
+        (tmp_path / name).write_text("")
+
+    searcher = _searcher(tmp_path)
+
+    assert sorted(searcher.iter_files_xml()) == sorted(
+        f"{tmp_path}/nf_{numero}.xml".replace("\\", "/") for numero in ("1234", "5678")
+    )
+    assert list(searcher.iter_files_xml("1234")) == [f"{tmp_path}/nf_1234.xml".replace("\\", "/")]
+    assert searcher.listing_files_xml("9999") is None
+
+
+def test_iter_files_xml_is_lazy(tmp_path):
+    searcher = _searcher(tmp_path / "inexistente")
+
+    # Nada é lido até o primeiro next()
+    files = searcher.iter_files_xml()
+    with pytest.raises(FileNotFoundError):
+        next(files)
+
+
+def test_listing_files_xml_wraps_missing_directory(tmp_path):
+    searcher = _searcher(tmp_path / "inexistente")
+
+    for cod_invoice in (None, "1234"):
+        with pytest.raises(OSError, match="Não foi possível acessar o diretório") as excinfo:
+            searcher.listing_files_xml(cod_invoice)
+        assert isinstance(excinfo.value.__cause__, FileNotFoundError)
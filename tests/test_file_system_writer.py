@@ -0,0 +1,214 @@
+"""
+Testes do FileSystemWriter.
+"""
+
+import errno
+import mmap
+import os
+import shutil
+import threading
+
+import pytest
+
+from danfe_generator.infrastructure import file_system_writer
+from danfe_generator.infrastructure.file_system_writer import FileSystemWriter
+
+
+@pytest.mark.parametrize("direct_io", [False, True])
+def test_write_recreates_directory_removed_between_writes(tmp_path, direct_io):
+    writer = FileSystemWriter(direct_io=direct_io)
+    output_dir = tmp_path / "saida" / "zpl"
+
+    writer.write("^XA1^XZ", output_dir / "a.zpl")
+    shutil.rmtree(tmp_path / "saida")
+    writer.write("^XA2^XZ", output_dir / "b.zpl")
+
+    assert (output_dir / "b.zpl").read_text(encoding="utf-8") == "^XA2^XZ"
+
+
+def test_write_concat_recreates_directory_removed_between_writes(tmp_path):
+    writer = FileSystemWriter()
+    output_dir = tmp_path / "spool"
+
+    writer.write_concat(["^XA1^XZ"], output_dir / "a.zpl")
+    shutil.rmtree(output_dir)
+    writer.write_concat(["^XA1^XZ", b"^XA2^XZ"], output_dir / "b.zpl")
+
+    assert (output_dir / "b.zpl").read_bytes() == b"^XA1^XZ^XA2^XZ"
+
+
+
+def test_direct_io_resumes_partial_os_write(tmp_path, monkeypatch):
+    real_write = os.write
+    calls = []
+
+    def write_three_bytes(fd, data):
+        calls.append(len(data))
+        return real_write(fd, bytes(data[:3]))
+
+    monkeypatch.setattr(file_system_writer.os, "write", write_three_bytes)
+    writer = FileSystemWriter(direct_io=True)
+
+    writer.write("^XAçã^XZ", tmp_path / "parcial.zpl")
+
+    assert (tmp_path / "parcial.zpl").read_bytes() == "^XAçã^XZ".encode("utf-8")
+    assert len(calls) == 4
+
+
+def test_direct_io_writes_bytes_unchanged(tmp_path):
+    writer = FileSystemWriter(direct_io=True)
+
+    writer.write(b"^XA\r\n^XZ", tmp_path / "bytes.zpl")
+
+    assert (tmp_path / "bytes.zpl").read_bytes() == b"^XA\r\n^XZ"
+
+
+def test_write_many_writes_every_item(tmp_path):
+    writer = FileSystemWriter()
+    items = [(f"^XA{i}^XZ", tmp_path / "lote" / f"{i}.zpl") for i in range(20)]
+    items.append((b"^XAbytes^XZ", tmp_path / "lote" / "bytes.zpl"))
+
+    writer.write_many(iter(items))
+
+    for content, path in items:
+        expected = content.encode("utf-8") if isinstance(content, str) else content
+        assert path.read_bytes() == expected
+
+
+class _BarrierWriter(FileSystemWriter):
+    """Escritor cujas duas primeiras escritas só terminam juntas."""
+
+    def __init__(self):
+        super().__init__()
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def write(self, content, file_path):
+        self.barrier.wait()
+        super().write(content, file_path)
+
+
+def test_write_many_overlaps_writes(tmp_path):
+    writer = _BarrierWriter()
+
+    # Em sequência, a primeira escrita esperaria a segunda para sempre
+    writer.write_many([("^XA1^XZ", tmp_path / "a.zpl"), ("^XA2^XZ", tmp_path / "b.zpl")])
+
+    assert (tmp_path / "b.zpl").read_text(encoding="utf-8") == "^XA2^XZ"
+
+
+def test_write_many_wraps_worker_errors(tmp_path):
+    writer = FileSystemWriter()
+    (tmp_path / "diretorio.zpl").mkdir()
+
+    with pytest.raises(IOError, match="diretorio.zpl"):
+        writer.write_many([("^XA1^XZ", tmp_path / "a.zpl"), ("^XA2^XZ", tmp_path / "diretorio.zpl")])
+
+
+needs_writev = pytest.mark.skipif(file_system_writer._WRITEV is None, reason="os.writev indisponível")
+
+
+@needs_writev
+def test_write_concat_resumes_partial_writev_in_iov_max_chunks(tmp_path, monkeypatch):
+    real_writev = os.writev
+    batches = []
+
+    def writev_seven_bytes(fd, buffers):
+        batches.append(len(buffers))
+        return real_writev(fd, [bytes(buffers[0])[:7]])
+
+    monkeypatch.setattr(file_system_writer, "_WRITEV", writev_seven_bytes)
+    monkeypatch.setattr(file_system_writer, "_IOV_MAX", 2)
+    contents = ["abc" * 5, b"", "ç" * 9, b"xyz", "^XA^XZ"]
+
+    FileSystemWriter().write_concat(contents, tmp_path / "spool.zpl")
+
+    assert (tmp_path / "spool.zpl").read_bytes() == ("abc" * 5 + "ç" * 9 + "xyz^XA^XZ").encode("utf-8")
+    assert max(batches) == 2
+
+
+@needs_writev
+def test_writev_all_passes_at_most_iov_max_buffers(tmp_path, monkeypatch):
+    batches = []
+
+    def record_writev(fd, buffers):
+        batches.append(len(buffers))
+        return os.writev(fd, buffers)
+
+    monkeypatch.setattr(file_system_writer, "_WRITEV", record_writev)
+    monkeypatch.setattr(file_system_writer, "_IOV_MAX", 3)
+    contents = [f"^XA{i}^XZ" for i in range(7)]
+
+    FileSystemWriter().write_concat(contents, tmp_path / "spool.zpl")
+
+    assert batches == [3, 3, 1]
+    assert (tmp_path / "spool.zpl").read_text(encoding="utf-8") == "".join(contents)
+
+
+def test_write_concat_without_writev_uses_writelines(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_system_writer, "_WRITEV", None)
+
+    FileSystemWriter().write_concat(["^XA1^XZ", b"^XA2^XZ"], tmp_path / "spool.zpl")
+
+    assert (tmp_path / "spool.zpl").read_bytes() == b"^XA1^XZ^XA2^XZ"
+
+needs_o_direct = pytest.mark.skipif(not file_system_writer._O_DIRECT, reason="O_DIRECT indisponível")
+
+
+def _big_zpl(size=100_000):
+    return "^XA" + "ç" * (size // 2) + "^XZ"
+
+
+@needs_o_direct
+def test_o_direct_write_replaces_target_without_padding(tmp_path, monkeypatch):
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(file_system_writer.os, "replace",
+                        lambda src, dst: (replaced.append(dst), real_replace(src, dst)))
+    writer = FileSystemWriter(direct_io=True)
+    target = tmp_path / "grande.zpl"
+    target.write_text("antigo", encoding="utf-8")
+    content = _big_zpl()
+
+    try:
+        writer.write(content, target)
+    finally:
+        writer.close()
+
+    data = target.read_bytes()
+    assert data == content.encode("utf-8")
+    assert not data.endswith(b"\0")
+    assert [p.name for p in tmp_path.iterdir()] == ["grande.zpl"]
+    if replaced:  # sistemas de arquivos sem O_DIRECT caem na escrita comum
+        assert replaced == [target]
+
+
+@needs_o_direct
+def test_o_direct_falls_back_on_einval(tmp_path, monkeypatch):
+    real_open = os.open
+
+    def open_without_o_direct(path, flags, *args):
+        if flags & file_system_writer._O_DIRECT:
+            raise OSError(errno.EINVAL, "Invalid argument")
+        return real_open(path, flags, *args)
+
+    monkeypatch.setattr(file_system_writer.os, "open", open_without_o_direct)
+    writer = FileSystemWriter(direct_io=True)
+    content = _big_zpl()
+
+    writer.write(content, tmp_path / "fallback.zpl")
+
+    assert (tmp_path / "fallback.zpl").read_bytes() == content.encode("utf-8")
+    assert [p.name for p in tmp_path.iterdir()] == ["fallback.zpl"]
+
+
+def test_close_releases_aligned_buffers(tmp_path):
+    writer = FileSystemWriter(direct_io=True)
+    buffer = mmap.mmap(-1, mmap.PAGESIZE)
+    writer._all_aligned_buffers.append(buffer)
+
+    writer.close()
+
+    assert buffer.closed
+    assert writer._all_aligned_buffers == []
+    writer.write(_big_zpl(), tmp_path / "depois.zpl")
+    assert (tmp_path / "depois.zpl").exists()
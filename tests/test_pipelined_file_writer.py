@@ -0,0 +1,103 @@
+"""
+Testes do PipelinedFileWriter.
+"""
+
+import gc
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import weakref
+from pathlib import Path
+
+import pytest
+
+from danfe_generator.infrastructure import FileSystemWriter, PipelinedFileWriter
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_pending_writes_are_saved_at_interpreter_exit(tmp_path):
+    script = textwrap.dedent(f"""
+        from danfe_generator.infrastructure import FileSystemWriter, PipelinedFileWriter
+        writer = PipelinedFileWriter(FileSystemWriter())
+        for i in range(50):
+            writer.write(f"^XA{{i}}^XZ", rf"{tmp_path}/{{i}}.zpl")
+    """)
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    subprocess.run([sys.executable, "-c", script], check=True, env=env, timeout=60)
+
+    assert len(list(tmp_path.glob("*.zpl"))) == 50
+    assert (tmp_path / "49.zpl").read_text(encoding="utf-8") == "^XA49^XZ"
+
+
+def test_write_after_close_raises(tmp_path):
+    writer = PipelinedFileWriter(FileSystemWriter())
+    writer.write("^XA^XZ", tmp_path / "a.zpl")
+    writer.close()
+
+    assert (tmp_path / "a.zpl").exists()
+    with pytest.raises(RuntimeError):
+        writer.write("^XA^XZ", tmp_path / "b.zpl")
+
+
+class _BlockingWriter(FileSystemWriter):
+    """Escritor que só grava depois que o teste libera o evento."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, content, file_path):
+        self.release.wait(timeout=10)
+        super().write(content, file_path)
+
+
+def test_close_and_writes_are_not_blocked_by_a_full_queue(tmp_path):
+    inner = _BlockingWriter()
+    writer = PipelinedFileWriter(inner, max_pending=1)
+    writer.write("^XA1^XZ", tmp_path / "1.zpl")  # retida pelo escritor interno
+    writer.write("^XA2^XZ", tmp_path / "2.zpl")  # ocupa a fila
+    producer = threading.Thread(target=writer.write, args=("^XA3^XZ", tmp_path / "3.zpl"))
+    producer.start()  # bloqueia no put com a fila cheia
+    closer = threading.Thread(target=writer.close)
+    closer.start()
+    deadline = time.monotonic() + 5
+    while not writer._closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError):
+        writer.write("^XA4^XZ", tmp_path / "4.zpl")
+    assert time.monotonic() - started < 1
+
+    inner.release.set()
+    producer.join(timeout=10)
+    closer.join(timeout=10)
+    assert sorted(p.name for p in tmp_path.glob("*.zpl")) == ["1.zpl", "2.zpl", "3.zpl"]
+
+
+def test_flush_raises_each_write_error_once(tmp_path):
+    blocker = tmp_path / "arquivo"
+    blocker.write_text("", encoding="utf-8")
+    writer = PipelinedFileWriter(FileSystemWriter())
+    writer.write("^XA^XZ", blocker / "a.zpl")  # o diretório pai é um arquivo
+
+    with pytest.raises(IOError):
+        writer.flush()
+    writer.flush()
+    writer.close()
+
+
+def test_closed_writer_is_not_kept_alive_by_atexit():
+    writer = PipelinedFileWriter(FileSystemWriter())
+    ref = weakref.ref(writer)
+
+    writer.close()
+    del writer
+    gc.collect()
+
+    assert ref() is None
@@ -0,0 +1,57 @@
+"""
+Testes do script legado projeto_principal.
+"""
+
+import pytest
+
+import projeto_principal
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2025-09-01T08:55:07-03:00", "01/09/2025 08:55:07"),
+    ("2025-09-01", "01/09/2025"),
+    ("2025-09-01-03:00", "01/09/2025"),
+])
+def test_format_nfe_datetime_handles_date_only_values(value, expected):
+    assert projeto_principal.format_nfe_datetime(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2025-09-01T08:55:05-03:00", "01/09/2025"),
+    ("2025-09-01", "01/09/2025"),
+    ("01/09/2025", "01/09/2025"),
+    ("", ""),
+])
+def test_format_iso_date_is_tolerant(value, expected):
+    assert projeto_principal.format_iso_date(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2025-09-01T08:55:07-03:00", "01/09/2025 08:55:07"),
+    ("2025-09-01", "01/09/2025"),
+    ("sem data", "sem data"),
+])
+def test_format_iso_datetime_is_tolerant(value, expected):
+    assert projeto_principal.format_iso_datetime(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("12345678000195", "12.345.678/0001-95"),
+    ("12345678901", "123.456.789-01"),
+    ("123", "123"),
+])
+def test_format_document_masks_cnpj_and_cpf(value, expected):
+    assert projeto_principal.format_document(value) == expected
+
+
+def test_formatters_reuse_cached_results():
+    # O mesmo emitente e a mesma data se repetem em todas as etiquetas do lote
+    for formatter, value in (
+        (projeto_principal.format_iso_date, "2025-09-02T10:00:00-03:00"),
+        (projeto_principal.format_iso_datetime, "2025-09-02T10:00:00-03:00"),
+        (projeto_principal.format_document, "98765432000198"),
+    ):
+        formatter.cache_clear()
+        first = formatter(value)
+        assert formatter(value) is first
+        assert formatter.cache_info().hits == 1
@@ -0,0 +1,113 @@
+"""
+Testes do SaveDANFEToFileUseCase.
+"""
+
+from dataclasses import fields
+from types import SimpleNamespace
+
+import pytest
+
+from danfe_generator.adapters.generators.standard_zpl_generator import StandardZPLGenerator
+from danfe_generator.adapters.parsers.xml_nfe_parser import XMLNFeParser
+from danfe_generator.domain.entities.danfe import DANFE
+from danfe_generator.infrastructure import FileSystemWriter
+from danfe_generator.use_cases.save_danfe_to_file import SaveDANFEToFileUseCase
+
+
+def test_danfe_fields_are_only_the_public_data():
+    assert [f.name for f in fields(DANFE)] == ["nfe_data", "codigo_zpl"]
+
+
+def test_save_paths_write_current_zpl_after_edit(make_nfe_xml, tmp_path):
+    danfe = StandardZPLGenerator().generate(XMLNFeParser().parse(make_nfe_xml()))
+    danfe.codigo_zpl = "^XA^FDEditado ç^FS^XZ"
+    use_case = SaveDANFEToFileUseCase(FileSystemWriter())
+
+    use_case.execute(danfe, tmp_path / "execute.zpl")
+    use_case.execute_many([danfe], [tmp_path / "many.zpl"])
+    use_case.execute_concat([danfe], tmp_path / "concat.zpl")
+    danfe.save_to_file(tmp_path / "entity.zpl")
+
+    expected = "^XA^FDEditado ç^FS^XZ".encode("utf-8")
+    for name in ("execute", "many", "concat", "entity"):
+        assert (tmp_path / f"{name}.zpl").read_bytes() == expected
+
+
+
+def test_execute_many_saves_each_danfe_to_its_path(make_nfe_xml, tmp_path):
+    danfes = [StandardZPLGenerator().generate(XMLNFeParser().parse(make_nfe_xml(numero)))
+              for numero in ("1111", "2222", "3333")]
+    paths = [tmp_path / f"{numero}.zpl" for numero in ("1111", "2222", "3333")]
+
+    SaveDANFEToFileUseCase(FileSystemWriter()).execute_many(danfes, paths)
+
+    for danfe, path in zip(danfes, paths):
+        assert path.read_bytes() == danfe.codigo_zpl.encode("utf-8")
+
+
+def test_execute_many_rejects_mismatched_paths(make_nfe_xml, tmp_path):
+    danfe = StandardZPLGenerator().generate(XMLNFeParser().parse(make_nfe_xml()))
+
+    with pytest.raises(ValueError, match="caminho de saída para cada DANFE"):
+        SaveDANFEToFileUseCase(FileSystemWriter()).execute_many([danfe, danfe], [tmp_path / "a.zpl"])
+    assert not (tmp_path / "a.zpl").exists()
+
+
+def test_execute_concat_writes_danfes_in_order(make_nfe_xml, tmp_path):
+    danfes = [StandardZPLGenerator().generate(XMLNFeParser().parse(make_nfe_xml(numero)))
+              for numero in ("1111", "2222", "3333")]
+
+    file_path = SaveDANFEToFileUseCase(FileSystemWriter()).execute_concat(danfes, tmp_path / "spool.zpl")
+
+    assert file_path == str(tmp_path / "spool.zpl")
+    assert (tmp_path / "spool.zpl").read_bytes() == "".join(d.codigo_zpl for d in danfes).encode("utf-8")
+
+class _CountingWriter(FileSystemWriter):
+    """Escritor síncrono que registra as chamadas a flush."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
+def _danfe(make_nfe_xml):
+    return StandardZPLGenerator().generate(XMLNFeParser().parse(make_nfe_xml()))
+
+
+def test_execute_does_not_wait_for_async_writer_by_default(make_nfe_xml, tmp_path):
+    writer = _CountingWriter()
+    SaveDANFEToFileUseCase(writer).execute(_danfe(make_nfe_xml), tmp_path / "a.zpl")
+    assert writer.flushes == 0
+
+    SaveDANFEToFileUseCase(writer, await_completion=True).execute(_danfe(make_nfe_xml), tmp_path / "b.zpl")
+    assert writer.flushes == 1
+
+
+def test_batch_methods_always_wait_for_async_writer(make_nfe_xml, tmp_path):
+    writer = _CountingWriter()
+    use_case = SaveDANFEToFileUseCase(writer)
+    danfe = _danfe(make_nfe_xml)
+
+    use_case.execute_many([danfe, danfe], [tmp_path / "a.zpl", tmp_path / "b.zpl"])
+    use_case.execute_concat([danfe, danfe], tmp_path / "spool.zpl")
+
+    assert writer.flushes == 2
+
+
+@pytest.mark.parametrize("method, args", [
+    ("execute", ("a.zpl",)),
+    ("execute_many", (["a.zpl"],)),
+    ("execute_concat", ("a.zpl",)),
+])
+def test_all_save_methods_reject_non_danfe(tmp_path, monkeypatch, method, args):
+    monkeypatch.chdir(tmp_path)
+    use_case = SaveDANFEToFileUseCase(FileSystemWriter())
+    fake = SimpleNamespace(codigo_zpl="^XA^XZ")
+    danfes = fake if method == "execute" else [fake]
+
+    with pytest.raises(ValueError, match="instância de DANFE"):
+        getattr(use_case, method)(danfes, *args)
+    assert not (tmp_path / "a.zpl").exists()
@@ -0,0 +1,66 @@
+"""
+Testes do SearchFileXMLUseCase.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from danfe_generator.domain.interfaces.file_search_xml import FileSearchXMLInterface
+from danfe_generator.use_cases import search_file_xml
+from danfe_generator.use_cases.search_file_xml import SearchFileXMLUseCase
+
+
+class _FakeSearchXML(FileSearchXMLInterface):
+    """Buscador com listagem controlada pelo teste, sobre um diretório real."""
+
+    def __init__(self, xml_dir_path, paths):
+        self.config = SimpleNamespace(xml_dir_path=str(xml_dir_path))
+        self.paths = list(paths)
+        self.calls = []
+
+    def listing_files_xml(self, cod_invoice=None):
+        self.calls.append(cod_invoice)
+        if cod_invoice:
+            return next((p for p in self.paths if cod_invoice in p.rsplit('/', 1)[-1]), None)
+        return list(self.paths)
+
+    def get_file_m_datetime(self, path):
+        return datetime.now()
+
+
+@pytest.fixture(autouse=True)
+def _clear_indexes():
+    search_file_xml._INDEXES.clear()
+    yield
+    search_file_xml._INDEXES.clear()
+
+
+def test_lookup_without_index_uses_streaming_search(tmp_path):
+    searcher = _FakeSearchXML(tmp_path, ["//share/xml/nf_1234.xml", "//share/xml/nf_5678.xml"])
+
+    assert SearchFileXMLUseCase(searcher).execute("1234") == "//share/xml/nf_1234.xml"
+    assert searcher.calls == ["1234"]
+
+
+def test_full_listing_index_is_reused_by_new_use_cases(tmp_path):
+    searcher = _FakeSearchXML(tmp_path, ["//share/xml/nf_1234.xml", "//share/xml/nf_5678.xml"])
+    assert SearchFileXMLUseCase(searcher).execute() == searcher.paths
+
+    # Cada facade cria o próprio caso de uso; o índice continua valendo
+    assert SearchFileXMLUseCase(searcher).execute("5678") == "//share/xml/nf_5678.xml"
+    assert searcher.calls == [None]
+
+
+def test_lookup_missing_from_index_falls_back_to_searcher(tmp_path):
+    searcher = _FakeSearchXML(tmp_path, ["//share/xml/nf_1234.xml"])
+    SearchFileXMLUseCase(searcher).execute()
+
+    # O XML chega sem alterar o mtime do diretório (cache de atributos do SMB)
+    searcher.paths.append("//share/xml/nf_5678.xml")
+
+    use_case = SearchFileXMLUseCase(searcher)
+    assert use_case.execute("5678") == "//share/xml/nf_5678.xml"
+    assert use_case.execute("9999") is None
+    assert searcher.calls == [None, "5678", "9999"]
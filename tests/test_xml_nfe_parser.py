@@ -0,0 +1,84 @@
+"""
+Testes do XMLNFeParser.
+"""
+
+import math
+import os
+from datetime import datetime
+
+from danfe_generator.adapters.parsers import xml_nfe_parser
+from danfe_generator.adapters.parsers.xml_nfe_parser import XMLNFeParser
+
+
+def test_parse_cache_returns_independent_copies(make_nfe_xml):
+    path = make_nfe_xml()
+    parser = XMLNFeParser(cache_size=8)
+
+    first = parser.parse(path)
+    first.emitente.nome = "Alterado"
+    first.destinatario.uf = "XX"
+    second = parser.parse(path)
+
+    assert second is not first
+    assert second.emitente.nome == "Empresa Exemplo LTDA"
+    assert second.destinatario.uf == "RJ"
+
+
+def test_parse_cache_is_opt_in(make_nfe_xml):
+    parser = XMLNFeParser()
+
+    parser.parse(make_nfe_xml())
+
+    assert not parser._cache
+
+
+def test_parse_cache_distinguishes_relative_paths_after_chdir(make_nfe_xml, tmp_path, monkeypatch):
+    a = make_nfe_xml("1111", tmp_path / "a")
+    b = make_nfe_xml("2222", tmp_path / "b")
+    (b.parent / a.name).write_bytes(b.read_bytes())
+    # Mesmo nome relativo, tamanho e mtime em diretórios diferentes
+    os.utime(b.parent / a.name, ns=(a.stat().st_atime_ns, a.stat().st_mtime_ns))
+    parser = XMLNFeParser(cache_size=8)
+
+    monkeypatch.chdir(a.parent)
+    assert parser.parse(a.name).numero == "1111"
+    monkeypatch.chdir(b.parent)
+    assert parser.parse(a.name).numero == "2222"
+
+
+class _RecordingExecutor:
+    """Substitui o ProcessPoolExecutor, executando no próprio processo."""
+
+    chunksizes = []
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def map(self, fn, iterable, chunksize=1):
+        self.chunksizes.append(chunksize)
+        return map(fn, iterable)
+
+
+def test_parse_many_splits_small_batches_across_workers(make_nfe_xml, monkeypatch):
+    monkeypatch.setattr(xml_nfe_parser, "ProcessPoolExecutor", _RecordingExecutor)
+    _RecordingExecutor.chunksizes = []
+    sources = [make_nfe_xml(f"{i:04d}") for i in range(10)]
+
+    notas = XMLNFeParser().parse_many(sources, workers=4)
+
+    assert [nota.numero for nota in notas] == [f"{i:04d}" for i in range(10)]
+    (chunksize,) = _RecordingExecutor.chunksizes
+    assert math.ceil(len(sources) / chunksize) > 1
+
+
+def test_parse_iso_datetime_date_only_is_midnight():
+    parser = XMLNFeParser()
+
+    assert parser._parse_iso_datetime("2025-09-01-03:00") == datetime(2025, 9, 1)
+    assert parser._parse_iso_datetime("2025-09-01T08:55:07-03:00") == datetime(2025, 9, 1, 8, 55, 7)